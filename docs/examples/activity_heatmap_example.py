@@ -1,5 +1,6 @@
 import random
 from collections import defaultdict
+from datetime import date
 
 from textual.app import App, ComposeResult
 from textual_timepiece.activity_heatmap import ActivityHeatmap, HeatmapManager
@@ -16,15 +17,13 @@ class ActivityApp(App[None]):
     def retrieve_data(self, year: int) -> ActivityHeatmap.ActivityData:
         """Placeholder example on how the data could be generated."""
         random.seed(year)
-        template = ActivityHeatmap.generate_empty_activity(year)
+        days = range(
+            date(year, 1, 1).toordinal(),
+            date(year + 1, 1, 1).toordinal(),
+        )
+        totals = random.choices(range(6000, 20001), k=len(days))
         return defaultdict(
-            lambda: 0,
-            {
-                day: random.randint(6000, 20000)
-                for week in template
-                for day in week
-                if day
-            },
+            int, zip(map(date.fromordinal, days), totals, strict=True)
         )
 
     def set_heatmap_data(self, year: int) -> None:
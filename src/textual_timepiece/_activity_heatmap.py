@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import math
 import sys
-from calendar import Calendar
+from array import array
 from calendar import day_abbr
+from calendar import isleap
 from calendar import month_abbr
-from calendar import monthrange
 from collections import defaultdict
 from datetime import date
-from functools import cached_property
+from functools import lru_cache
 from itertools import chain
 from typing import TYPE_CHECKING
 from typing import ClassVar
@@ -15,6 +16,8 @@ from typing import NamedTuple
 from typing import TypeAlias
 from typing import cast
 
+from ._extra import cached_property
+
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
@@ -46,16 +49,12 @@ from textual.widgets import Button
 from textual.widgets import Input
 from textual.widgets import MaskedInput
 from whenever import Date
-from whenever import days
 
 from textual_timepiece._extra import BaseMessage
 
 from ._extra import BaseWidget
 from ._extra import TargetButton
-from ._utility import flat_to_shape
 from ._utility import format_seconds
-from ._utility import iterate_timespan
-from ._utility import normalize_values
 
 if TYPE_CHECKING:
     from rich.color import Color as RColor
@@ -64,6 +63,58 @@ if TYPE_CHECKING:
     from textual_timepiece._types import Directions
 
 
+def _iso_weeks(year: int) -> int:
+    def p(y: int) -> int:
+        return (y + y // 4 - y // 100 + y // 400) % 7
+
+    return 53 if p(year) == 4 or p(year - 1) == 3 else 52
+
+
+@lru_cache(maxsize=64)
+def _iso_week_start(year: int) -> int:
+    jan_fourth = date(year, 1, 4)
+    return jan_fourth.toordinal() - jan_fourth.weekday()
+
+
+def _iso_to_date(year: int, week: int, day: int) -> date | None:
+    """Arithmetic `date.fromisocalendar` that returns None when invalid."""
+    if not (
+        date.min.year <= year <= date.max.year
+        and 1 <= week <= _iso_weeks(year)
+        and 1 <= day <= 7
+    ):
+        return None
+
+    ordinal = _iso_week_start(year) + (week - 1) * 7 + day - 1
+    if ordinal > date.max.toordinal():
+        return None
+    return date.fromordinal(ordinal)
+
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if month == 2 and isleap(year):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+@lru_cache(maxsize=32)
+def _month_tiles(
+    year: int, weeks: int
+) -> dict[int, frozenset[tuple[int, int]]]:
+    months: defaultdict[int, set[tuple[int, int]]] = defaultdict(set)
+    for week in range(weeks):
+        iso_year, iso_week = (year + 1, 1) if week == 52 else (year, week + 1)
+        for day in range(7):
+            cal = _iso_to_date(iso_year, iso_week, day + 1)
+            if cal is not None and cal.year == year:
+                months[cal.month].add((week, day))
+
+    return {month: frozenset(tiles) for month, tiles in months.items()}
+
+
 class HeatmapCursor(NamedTuple):
     """Cursor for navigating a heatmap with the keyboard or mouse."""
 
@@ -72,21 +123,19 @@ class HeatmapCursor(NamedTuple):
     month: int | None = None
 
     def to_date(self, year: int) -> Date | None:
+        day = self.to_pydate(year)
+        return None if day is None else Date.from_py_date(day)
+
+    def to_pydate(self, year: int) -> date | None:
         if self.is_month:
-            return Date(year, cast("int", self.month), 1)
+            return date(year, cast("int", self.month), 1)
 
         if (week := self.week) == 53:
             week = 1
             year += 1
 
-        try:
-            return Date.from_py_date(
-                date.fromisocalendar(
-                    year, week, 1 if self.is_week else self.day
-                )
-            )
-        except ValueError:  # NOTE: Deals with far reach edge cases.
-            return None
+        # NOTE: Far reach edge cases produce no date.
+        return _iso_to_date(year, week, 1 if self.is_week else self.day)
 
     def move(
         self,
@@ -99,9 +148,9 @@ class HeatmapCursor(NamedTuple):
         day = self.day + day_delta
         if day == 9:
             if self.is_month:
-                if (cursor_date := self.to_date(year)) is None:
+                if (cursor_date := self.to_pydate(year)) is None:
                     return self
-                iso = cursor_date.py_date()
+                iso = cursor_date
             else:
                 iso = date.fromisocalendar(year, min(week + 1, 52), 1)
 
@@ -123,6 +172,39 @@ class HeatmapCursor(NamedTuple):
         return self.month is not None
 
 
+class _HeatmapStyles(NamedTuple):
+    empty: RStyle
+    empty_alt: RStyle
+    hover: RStyle
+    color: Color
+    background: Color
+    empty_seg: Segment
+    empty_tile: Segment
+    hover_tile: Segment
+    month_gap: Segment
+    day_lead: Segment
+    week_lead: Segment
+    month_lead: Segment
+    tiles: dict[float, Segment]
+    """Tile segments interned by their normalized value."""
+    headers: dict[tuple[int, int | None], Strip]
+    """Week & month rows keyed by their line and hovered label."""
+
+
+@lru_cache(maxsize=32)
+def _empty_activity(year: int) -> tuple[tuple[date | None, ...], ...]:
+    first = date(year, 1, 1).toordinal()
+    last = first + (366 if isleap(year) else 365)
+    start = first - date.fromordinal(first).weekday()
+    return tuple(
+        tuple(
+            date.fromordinal(day) if first <= day < last else None
+            for day in range(week, week + 7)
+        )
+        for week in range(start, last, 7)
+    )
+
+
 # TODO: Dirty region tracking.
 
 
@@ -298,10 +380,10 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
     data = reactive[list[list[float]]](list, init=False, layout=True)
     """Two dimensional data that should be normalized between 0 and 1."""
 
-    year = var[int](lambda: Date.today_in_system_tz().year, init=False)
+    year = var[int](lambda: BaseWidget._today().year, init=False)
     """Current year for calculating dates."""
 
-    values = var[ActivityData](lambda: defaultdict(lambda: 0), init=False)
+    values = var[ActivityData](lambda: defaultdict(int), init=False)
     """Original pre normalized values for tooltips.
 
     Assign data to this reactive to update values.
@@ -328,6 +410,15 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
 
         self.select_on_focus = select_on_focus
         self.virtual_size = Size(163, 18)
+        self._processed: tuple[int, list[float | None]] | None = None
+        self._tiles = array("d")
+        self._pending_offset: Offset | None = None
+        self._week_totals: dict[date, float] = {}
+        self._month_totals: dict[date, float] = {}
+        self._hovered: tuple[
+            tuple[HeatmapCursor | None, int, int] | None,
+            frozenset[tuple[int, int]],
+        ] = (None, frozenset())
         if values:
             self.set_reactive(ActivityHeatmap.values, values)
         if year:
@@ -341,82 +432,72 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
     ) -> RColor:
         return base.blend(bg, value).rich_color
 
-    def _get_day_style(
-        self,
-        day: int,
-        week: int,
-        value: float,
-        background: Color,
-        color: Color,
-        hover_color: RStyle,
-    ) -> RStyle:
-        if self._is_tile_hovered(day=day, week=week):
-            return hover_color
-
-        return RStyle(color=self._get_color_strength(value, color, background))
-
-    def _get_segment(
-        self,
-        day: int,
-        week: int,
-        background: Color,
-        color: Color,
-        hover_color: RStyle,
-        empty: RStyle,
-    ) -> Segment:
-        if (value := self.data[week][day]) is not None:
-            return Segment(
-                "██",
-                style=self._get_day_style(
-                    day, week, value, background, color, hover_color
-                ),
-            )
-        if self._is_tile_hovered(day=day, week=week):
-            return Segment("██", hover_color)
-
-        return Segment("  ", style=empty)
-
-    def _render_weekday(
-        self,
-        y: int,
-        empty_bg: RStyle,
-        empty_seg: Segment,
-    ) -> Strip:
-        base_color = self.get_component_rich_style("activityheatmap--color")
-        empty_alt = self.get_component_rich_style("activityheatmap--empty-alt")
-        hover_color = self.get_component_rich_style("activityheatmap--hover")
+    def _render_weekday(self, y: int, styles: _HeatmapStyles) -> Strip:
+        empty_seg, empty_tile, cache = (
+            styles.empty_seg,
+            styles.empty_tile,
+            styles.tiles,
+        )
         day = y // 2
+        values = self._tiles[day::7]
 
-        color, background = (
-            Color.from_rich_color(base_color.color),
-            Color.from_rich_color(base_color.bgcolor),
+        # NOTE: Day label, then alternating gap and tile segments.
+        segs = [empty_seg] * (len(values) * 2 + 1)
+        segs[0] = Segment(
+            day_abbr[day],
+            styles.empty if day % 2 == 0 else styles.empty_alt,
         )
-        segs = [
-            Segment(day_abbr[day], empty_bg if day % 2 == 0 else empty_alt),
-            empty_seg,
-        ]
-        empty_bg = empty_bg.background_style
-        for week in range(len(self.data)):
-            segs.append(empty_seg)
-            segs.append(
-                self._get_segment(
-                    day, week, background, color, hover_color, empty_bg
+        if values:
+            segs[1] = styles.day_lead
+
+        for i, value in enumerate(values, 1):
+            if math.isnan(value):
+                segs[i * 2] = empty_tile
+            elif (tile := cache.get(value)) is not None:
+                segs[i * 2] = tile
+            else:
+                color = self._get_color_strength(
+                    value, styles.color, styles.background
                 )
-            )
+                segs[i * 2] = cache[value] = Segment("██", RStyle(color=color))
+
+        if hovered := self._get_hovered_tiles():
+            for week, hover_day in hovered:
+                if hover_day == day and 0 <= week < len(values):
+                    segs[week * 2 + 2] = styles.hover_tile
 
         return Strip(segs)
 
-    def _render_weeks(
-        self,
-        empty_background: RStyle,
-        empty_seg: Segment,
-    ) -> Strip:
-        empty_alt = self.get_component_rich_style("activityheatmap--empty-alt")
-        hover_color = self.get_component_rich_style("activityheatmap--hover")
+    def _render_header(self, y: int, styles: _HeatmapStyles) -> Strip:
+        cursor = self.cursor
+        hovered = None
+        if cursor is not None:
+            if y == 15 and cursor.is_week:
+                hovered = cursor.week
+            elif y == 17:
+                hovered = cursor.month
+
+        if (strip := styles.headers.get((y, hovered))) is None:
+            strip = styles.headers[(y, hovered)] = (
+                self._render_weeks(styles)
+                if y == 15
+                else self._render_months(styles)
+            )
+        return strip
+
+    def _render_weeks(self, styles: _HeatmapStyles) -> Strip:
+        empty_background, empty_alt, hover_color = (
+            styles.empty,
+            styles.empty_alt,
+            styles.hover,
+        )
+        empty_seg = styles.empty_seg
 
-        segments = [Segment(" " * 4, style=empty_seg.style)]
+        segments: list[Segment] = []
+        gap = styles.week_lead
         for i in range(2, 108, 2):
-            segments.append(empty_seg)
+            segments.append(gap)
+            gap = empty_seg
             style = (
                 hover_color
                 if self._is_tile_hovered(week=i // 2)
@@ -428,14 +509,13 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
 
         return Strip(segments)
 
-    def _render_months(
-        self,
-        empty_background: RStyle,
-        empty_seg: Segment,
-    ) -> Strip:
-        empty_alt = self.get_component_rich_style("activityheatmap--empty-alt")
-        hover_color = self.get_component_rich_style("activityheatmap--hover")
-        segments = [empty_seg] * 3
+    def _render_months(self, styles: _HeatmapStyles) -> Strip:
+        empty_background, empty_alt, hover_color = (
+            styles.empty,
+            styles.empty_alt,
+            styles.hover,
+        )
+        segments = [styles.month_lead]
         for month in range(1, 13):
             segments.append(
                 Segment(
@@ -447,30 +527,35 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
                     else empty_alt,
                 )
             )
-            segments.append(Segment(" " * 10, style=empty_background))
+            segments.append(styles.month_gap)
         return Strip(segments)
 
     def render_line(self, y: int) -> Strip:
-        empty_background = self.get_component_rich_style(
-            "activityheatmap--empty"
-        )
-        empty_seg = Segment(" ", style=empty_background)
-
+        styles = self._styles
         scroll_x, scroll_y = self.scroll_offset
         y += scroll_y
 
-        if y == 15:
-            strip = self._render_weeks(empty_background, empty_seg)
-        elif y == 17:
-            strip = self._render_months(empty_background, empty_seg)
+        if y in {15, 17}:
+            strip = self._render_header(y, styles)
         elif y % 2 == 0 or not self.data or (len(self.data[0]) * 2) < y - 2:
-            strip = Strip.blank(self.size.width, style=empty_background)
+            strip = Strip.blank(self.size.width, style=styles.empty)
         else:
-            strip = self._render_weekday(y, empty_background, empty_seg)
+            strip = self._render_weekday(y, styles)
 
         return strip.crop(scroll_x, scroll_x + self.size.width)
 
+    def _watch_data(self, data: list[list[float | None]]) -> None:
+        self._tiles = array(
+            "d",
+            (math.nan if v is None else v for week in data for v in week),
+        )
+        # NOTE: Interned tiles are only reused within a single data set.
+        if (styles := self.__dict__.get("_styles")) is not None:
+            styles.tiles.clear()
+
     def _watch_values(self, new: ActivityData) -> None:
+        self._week_totals.clear()
+        self._month_totals.clear()
         self._process_data(new, self.year)
 
     @work(name="heatmap", thread=True, exclusive=True)
@@ -483,30 +568,49 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
             data: Two dimensional data that is ready to be converted.
             year: The year the provided data belongs to.
         """
-        template = ActivityHeatmap.generate_empty_activity(year)
+        template = _empty_activity(year)
         values = [
-            [data[day] if day else None for day in week] for week in template
+            [data.get(day, 0) if day else None for day in week]
+            for week in template
         ]
         flat: list[float | None] = list(chain.from_iterable(values))
-        normalized = [
-            1 - v if v is not None else None for v in normalize_values(flat)
+        if self._processed == (year, flat):
+            return
+
+        self._processed = (year, flat)
+        present = [v for v in flat if v is not None]
+        low = min(present)
+        span = (max(present) - low) or 1
+        inverted = [
+            [None if v is None else 1 - (v - low) / span for v in week]
+            for week in values
         ]
-        self.app.call_from_thread(
-            setattr, self, "data", flat_to_shape(normalized, values)
-        )
+        self.app.call_from_thread(setattr, self, "data", inverted)
 
     def _on_focus(self, event: Focus) -> None:
         self.action_move_cursor("right")
 
     def _on_leave(self, event: Leave) -> None:
+        # NOTE: Drops a coalesced move that would light up a tile again.
+        self._pending_offset = None
         if not self.has_focus:
             self.cursor = None
 
     def _on_blur(self, event: Blur) -> None:
+        self._pending_offset = None
         self.cursor = None
 
     def _on_mouse_move(self, event: MouseMove) -> None:
-        self.mouse_offset = event.offset + self.scroll_offset
+        # NOTE: Coalesces bursts of queued moves into a single cursor update.
+        scheduled = self._pending_offset is not None
+        self._pending_offset = event.offset + self.scroll_offset
+        if not scheduled:
+            self.call_later(self._apply_mouse_offset)
+
+    def _apply_mouse_offset(self) -> None:
+        if self._pending_offset is not None:
+            self.mouse_offset = self._pending_offset
+            self._pending_offset = None
 
     def _validate_date(self, day: Date) -> Date:
         return Date(day.year, 1, 1)
@@ -533,21 +637,28 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
     @on(Click)
     def _action_select_tile(self) -> None:
         if (day := self._date_lookup()) is not None:
-            self.post_message(self.DaySelected(self, day))
+            self.post_message(self.DaySelected(self, Date.from_py_date(day)))
         elif (week := self._week_lookup()) is not None:
-            self.post_message(self.WeekSelected(self, week))
+            self.post_message(self.WeekSelected(self, Date.from_py_date(week)))
         elif (month := self._month_lookup()) is not None:
-            self.post_message(self.MonthSelected(self, month))
+            self.post_message(
+                self.MonthSelected(self, Date.from_py_date(month))
+            )
 
         self.cursor = None
 
     def _watch_mouse_offset(self, new: Offset) -> None:
-        self.cursor = (
+        self._set_cursor(
             self._get_cursor_tile(new)
             or self._get_cursor_week(new)
             or self._get_cursor_month(new)
         )
 
+    def _set_cursor(self, cursor: HeatmapCursor | None) -> None:
+        # NOTE: Skips the reactive machinery while moving within a tile.
+        if cursor != self.cursor:
+            self.cursor = cursor
+
     def _is_tile_hovered(
         self,
         *,
@@ -571,9 +682,7 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
                 if week == 52:
                     week = 0
                     year += 1
-                try:
-                    cal = date.fromisocalendar(year, week + 1, day + 1)
-                except ValueError:
+                if (cal := _iso_to_date(year, week + 1, day + 1)) is None:
                     return False
                 return cal.month == self.cursor.month and cal.year == self.year
 
@@ -582,27 +691,41 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
 
         return day + 1 == self.cursor.day and week + 1 == self.cursor.week
 
-    def _is_offset_on_tile(self, offset: Offset) -> bool:
-        return bool(
-            4 <= offset.x <= 165
-            and 1 <= offset.y <= 14
-            and ((offset.x - 4) % 3 != 0)
-            and offset.y % 2 != 0
-        )
+    def _get_hovered_tiles(self) -> frozenset[tuple[int, int]]:
+        """Tile coordinates under the cursor, cached until the cursor moves."""
+        key = (self.cursor, self.year, len(self.data))
+        if self._hovered[0] == key:
+            return self._hovered[1]
+
+        cursor = self.cursor
+        tiles: frozenset[tuple[int, int]]
+        if cursor is None:
+            tiles = frozenset()
+        elif cursor.is_week:
+            tiles = frozenset((cursor.week - 1, day) for day in range(7))
+        elif cursor.is_month:
+            tiles = _month_tiles(self.year, len(self.data)).get(
+                cast("int", cursor.month), frozenset()
+            )
+        else:
+            tiles = frozenset({(cursor.week - 1, cursor.day - 1)})
+
+        self._hovered = (key, tiles)
+        return tiles
 
     def action_move_cursor(self, direction: Directions) -> None:
         """Move the keyboard cursor."""
         if self.cursor is None:
-            self.cursor = HeatmapCursor(1, 1)
+            self._set_cursor(HeatmapCursor(1, 1))
 
         elif direction == "right":
-            self.cursor = self.cursor.move(self.year, week_delta=1)
+            self._set_cursor(self.cursor.move(self.year, week_delta=1))
         elif direction == "down":
-            self.cursor = self.cursor.move(self.year, day_delta=1)
+            self._set_cursor(self.cursor.move(self.year, day_delta=1))
         elif direction == "left":
-            self.cursor = self.cursor.move(self.year, week_delta=-1)
+            self._set_cursor(self.cursor.move(self.year, week_delta=-1))
         elif direction == "up":
-            self.cursor = self.cursor.move(self.year, day_delta=-1)
+            self._set_cursor(self.cursor.move(self.year, day_delta=-1))
 
     def action_clear_cursor(self) -> None:
         """Clear the navigation cursor."""
@@ -639,17 +762,16 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
         return 18
 
     def _get_cursor_tile(self, offset: Offset) -> HeatmapCursor | None:
-        if self._is_offset_on_tile(offset):
-            return HeatmapCursor(
-                ((offset.x - 4) // 3) + 1,
-                ((offset.y - 1) // 2) + 1,
-            )
+        dx, dy = offset.x - 4, offset.y - 1
+        if 0 <= dx <= 161 and 0 <= dy <= 13 and dx % 3 and not dy & 1:
+            return HeatmapCursor(dx // 3 + 1, dy // 2 + 1)
 
         return None
 
     def _get_cursor_week(self, offset: Offset) -> HeatmapCursor | None:
-        if offset.y == 15 and 5 <= offset.x <= 165 and offset.x - 2 % 3 != 0:
-            return HeatmapCursor(((offset.x - 4) // 3) + 1, 8)
+        dx = offset.x - 4
+        if offset.y == 15 and 0 <= dx <= 161 and dx % 3:
+            return HeatmapCursor(dx // 3 + 1, 8)
 
         return None
 
@@ -660,55 +782,62 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
         return None
 
     def _is_offset_on_month(self, offset: Offset) -> int:
-        if offset.y != 17 or not (3 <= offset.x <= 148):
+        dx = offset.x - 3
+        if offset.y != 17 or not 0 <= dx <= 145:
             return 0
 
-        month, rem = divmod(offset.x - 2, 13)
-
-        if rem not in {0, 1, 2}:
-            return 0
+        month, rem = divmod(dx, 13)
+        return month + 1 if rem < 3 else 0
 
-        return month + 1
-
-    def _date_lookup(self) -> Date | None:
+    def _date_lookup(self) -> date | None:
         if (
             self.cursor is not None
             and self.cursor.is_day
-            and (day := self.cursor.to_date(self.year)) is not None
+            and (day := self.cursor.to_pydate(self.year)) is not None
             and day.year == self.year
         ):
             return day
 
         return None
 
-    def _week_lookup(self) -> Date | None:
+    def _week_lookup(self) -> date | None:
         if self.cursor is not None and self.cursor.is_week:
-            return self.cursor.to_date(self.year)
+            return self.cursor.to_pydate(self.year)
 
         return None
 
-    def _month_lookup(self) -> Date | None:
+    def _month_lookup(self) -> date | None:
         if self.cursor is not None and self.cursor.is_month:
-            return self.cursor.to_date(self.year)
+            return self.cursor.to_pydate(self.year)
 
         return None
 
     def sum_week(self, week: Date) -> float:
         """Get the total for a week for any specified date."""
-        return sum(
-            self.values[day.py_date()]
-            for day in iterate_timespan(week, days(1), 7)
-        )
+        return self._sum_week(week.py_date())
+
+    def _sum_week(self, week: date) -> float:
+        if (total := self._week_totals.get(week)) is None:
+            total = self._week_totals[week] = self._sum_days(week, 7)
+        return total
 
     def sum_month(self, month: Date) -> float:
         """Get the total for a month for any specified date."""
-        return sum(
-            self.values[day.py_date()]
-            for day in iterate_timespan(
-                month,
-                days(1),
-                monthrange(month.year, month.month)[1],
+        return self._sum_month(month.py_date())
+
+    def _sum_month(self, month: date) -> float:
+        if (total := self._month_totals.get(month)) is None:
+            total = self._month_totals[month] = self._sum_days(
+                month, _days_in_month(month.year, month.month)
             )
+        return total
+
+    def _sum_days(self, start: date, length: int) -> float:
+        get = self.values.get
+        first = start.toordinal()
+        return sum(
+            get(date.fromordinal(day), 0)
+            for day in range(first, first + length)
         )
 
     @staticmethod
@@ -722,38 +851,49 @@ class ActivityHeatmap(ScrollView, BaseWidget, can_focus=True):
             A 2 dimensional array of dates or None if the day belongs to
                 another year.
         """
-        raw = list(
-            chain.from_iterable(Calendar().yeardatescalendar(year, 12)[0])
-        )
-        new_cal: list[list[date | None]] = []
-        for i, week in enumerate(raw):
-            if i and week[0] in new_cal[-1]:
-                continue
+        return [list(week) for week in _empty_activity(year)]
 
-            new_cal.append([])
-            for day in week:
-                if day.year != year:
-                    new_cal[-1].append(None)
-                else:
-                    new_cal[-1].append(day)
+    def notify_style_update(self) -> None:
+        self.__dict__.pop("_styles", None)
+        super().notify_style_update()
 
-        return new_cal
+    @cached_property
+    def _styles(self) -> _HeatmapStyles:
+        base = self.get_component_rich_style("activityheatmap--color")
+        empty = self.get_component_rich_style("activityheatmap--empty")
+        hover = self.get_component_rich_style("activityheatmap--hover")
+        return _HeatmapStyles(
+            empty,
+            self.get_component_rich_style("activityheatmap--empty-alt"),
+            hover,
+            Color.from_rich_color(base.color),
+            Color.from_rich_color(base.bgcolor),
+            Segment(" ", style=empty),
+            Segment("  ", style=empty.background_style),
+            Segment("██", style=hover),
+            Segment(" " * 10, style=empty),
+            Segment(" " * 2, style=empty),
+            Segment(" " * 5, style=empty),
+            Segment(" " * 3, style=empty),
+            {},
+            {},
+        )
 
     @property  # type: ignore[misc]  # NOTE: Tooltip is generated inside.
     def tooltip(self) -> str | None:  # type: ignore[override]
         if (tip_date := self._date_lookup()) is not None:
-            total = int(self.values[tip_date.py_date()])
-            tooltip = f"{tip_date.py_date():%-d %B}\n"
+            total = int(self.values.get(tip_date, 0))
+            tooltip = f"{tip_date:%-d %B}\n"
             return tooltip + format_seconds(total, include_seconds=False)
 
         if (tip_week := self._week_lookup()) is not None:
-            total = int(self.sum_week(tip_week))
-            tooltip = f"{tip_week.py_date():%U week of %Y}\n"
+            total = int(self._sum_week(tip_week))
+            tooltip = f"{tip_week:%U week of %Y}\n"
             return tooltip + format_seconds(total, include_seconds=False)
 
         if (tip_month := self._month_lookup()) is not None:
-            total = int(self.sum_month(tip_month))
-            tooltip = f"{tip_month.py_date():%B %Y}\n"
+            total = int(self._sum_month(tip_month))
+            tooltip = f"{tip_month:%B %Y}\n"
             return tooltip + format_seconds(total, include_seconds=False)
 
         return None
@@ -820,7 +960,7 @@ class HeatmapManager(BaseWidget):
     """Default CSS for the `HeatmapManager`."""
 
     year = var[int](
-        lambda: Date.today_in_system_tz().year, init=False, bindings=True
+        lambda: BaseWidget._today().year, init=False, bindings=True
     )
     """Current year that the widget is set to. Max is 9999 and minimum 1"""
 
@@ -891,7 +1031,7 @@ class HeatmapManager(BaseWidget):
             elif button.id in {"next-year", "next-year-5"}:
                 button.disabled = year >= 9998
             elif button.id == "today-button":
-                button.disabled = year == Date.today_in_system_tz().year
+                button.disabled = year == self._today().year
         self.post_message(self.YearChanged(self, year))
 
     def _on_descendant_focus(self) -> None:
@@ -922,7 +1062,7 @@ class HeatmapManager(BaseWidget):
         elif message.button.id == "next-year-5":
             self.year += 5
         elif message.button.id == "today-button":
-            self.year = Date.today_in_system_tz().year
+            self.year = self._today().year
 
         with self.year_input.prevent(Input.Changed):
             self.year_input.value = str(self.year)
@@ -3,8 +3,11 @@ from __future__ import annotations
 import inspect
 import random
 from collections import defaultdict
-from dataclasses import dataclass
-from functools import cached_property
+from datetime import date
+from functools import cache
+from functools import lru_cache
+from functools import partial
+from itertools import chain
 from typing import TYPE_CHECKING
 from typing import ClassVar
 from typing import Literal
@@ -12,6 +15,7 @@ from typing import Literal
 from rich.pretty import Pretty
 from rich.syntax import Syntax
 from textual import on
+from textual import work
 from textual.app import App
 from textual.app import ComposeResult
 from textual.containers import Container
@@ -32,6 +36,7 @@ from textual.widgets import TabPane
 from textual_timepiece.__about__ import __version__
 from textual_timepiece._activity_heatmap import ActivityHeatmap
 from textual_timepiece._activity_heatmap import HeatmapManager
+from textual_timepiece._extra import cached_property
 from textual_timepiece.pickers import DatePicker
 from textual_timepiece.pickers import DateRangePicker
 from textual_timepiece.pickers import DateTimeDurationPicker
@@ -48,21 +53,80 @@ from textual_timepiece.timeline._timeline_manager import (
 from textual_timepiece.timeline._timeline_manager import RuledVerticalTimeline
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from rich.console import RenderableType
     from textual.events import Mount
+    from textual.timer import Timer
+
+
+@cache
+def _navigation_buttons(widget: type[Widget]) -> tuple[tuple[str, str], ...]:
+    buttons = []
+    if getattr(widget, "DEFAULT_CSS", None):
+        buttons.append(("default-css", "Default CSS"))
+    if getattr(widget, "BINDINGS", None):
+        buttons.append(("bindings", "Bindings"))
+    buttons.append(("code", "Code Preview"))
+    return tuple(buttons)
+
+
+def _render_source(widget: type[Widget]) -> Syntax:
+    return Syntax(
+        inspect.getsource(widget),
+        "python",
+        line_numbers=True,
+        padding=1,
+    )
+
+
+_PREVIEW_BUILDERS: dict[str, Callable[[type[Widget]], RenderableType]] = {
+    "tcss": lambda widget: widget.DEFAULT_CSS,
+    "bindings": lambda widget: Pretty(widget.BINDINGS),
+    "docstring": lambda widget: str(widget.__doc__),
+    "code": _render_source,
+}
+
+
+@lru_cache(maxsize=64)
+def _render_preview(widget: type[Widget], preview: str) -> RenderableType:
+    return _PREVIEW_BUILDERS[preview](widget)
+
+
+@lru_cache(maxsize=16)
+def _fake_totals(year: int) -> tuple[tuple[date, int], ...]:
+    random.seed(year)
+    days = range(
+        date(year, 1, 1).toordinal(),
+        date(year + 1, 1, 1).toordinal(),
+    )
+    totals = random.choices(range(6000, 20001), k=len(days))  # noqa: S311
+    return tuple(zip(map(date.fromordinal, days), totals, strict=True))
+
+
+def _fake_activity(year: int) -> ActivityHeatmap.ActivityData:
+    # NOTE: Fresh mapping per widget as the heatmap may insert missing days.
+    return defaultdict(int, _fake_totals(year))
 
 
 class DemoWidget(Widget):
     """Displays each widget with additional information."""
 
-    @dataclass
     class Toggle(Message):
         """Sent when the user presses one of the buttons."""
 
-        widget: type[Widget]
-        preview: Literal[
-            "docstring", "tcss", "code", "docs", "source", "bindings"
-        ]
+        __slots__ = ("preview", "widget")
+
+        def __init__(
+            self,
+            widget: type[Widget],
+            preview: Literal[
+                "docstring", "tcss", "code", "docs", "source", "bindings"
+            ],
+        ) -> None:
+            super().__init__()
+            self.widget = widget
+            self.preview = preview
 
     def __init__(
         self,
@@ -78,23 +142,14 @@ class DemoWidget(Widget):
 
         self._notes = notes
         self._widget_type = widget_call
+        self._nav_buttons = _navigation_buttons(widget_call)
 
     def _compose_navigation_bar(self) -> ComposeResult:
         with Horizontal(id="navigation"):
             yield Button("Docstring", id="docstring", classes="nav")
             yield Label(self._widget_type.__name__, classes="title")
-            if (
-                hasattr(self._widget_type, "DEFAULT_CSS")
-                and self._widget_type.DEFAULT_CSS
-            ):
-                yield Button("Default CSS", id="default-css", classes="nav")
-            if (
-                hasattr(self._widget_type, "BINDINGS")
-                and self._widget_type.BINDINGS
-            ):
-                yield Button("Bindings", id="bindings", classes="nav")
-
-            yield Button("Code Preview", id="code", classes="nav")
+            for button_id, label in self._nav_buttons:
+                yield Button(label, id=button_id, classes="nav")
 
     def compose(self) -> ComposeResult:
         """Compose the layout for the widget."""
@@ -127,7 +182,7 @@ class PreviewScreen(ModalScreen[None]):
 
     def __init__(
         self,
-        renderable: RenderableType,
+        renderable: RenderableType = "",
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -138,6 +193,13 @@ class PreviewScreen(ModalScreen[None]):
     def _on_mount(self, event: Mount) -> None:
         self.refresh_bindings()
 
+    def set_renderable(self, renderable: RenderableType) -> None:
+        """Swap out the displayed renderable so the screen can be reused."""
+        self._renderable = renderable
+        if self.is_mounted:
+            self.query_one("#preview", Static).update(renderable)
+            self.query_one(ScrollableContainer).scroll_home(animate=False)
+
     def compose(self) -> ComposeResult:
         """Generate the layout for the screen."""
         with Container():
@@ -242,6 +304,34 @@ class TimepieceDemo(App[None]):
     TITLE = "Textual Timepiece"
     SUB_TITLE = __version__
 
+    SCREENS: ClassVar = {"preview": PreviewScreen}
+
+    YEAR_DEBOUNCE: ClassVar[float] = 0.05
+    """Delay before loading data so rapid year changes only load the last."""
+
+    PICKERS: ClassVar[tuple[type[Widget], ...]] = (
+        DatePicker,
+        DurationPicker,
+        TimePicker,
+        DateTimePicker,
+        DateRangePicker,
+        DateTimeRangePicker,
+        DateTimeDurationPicker,
+    )
+    SELECTS: ClassVar[tuple[type[Widget], ...]] = (
+        DateSelect,
+        TimeSelect,
+        DurationSelect,
+    )
+    HEATMAPS: ClassVar[tuple[type[Widget], ...]] = (
+        ActivityHeatmap,
+        HeatmapManager,
+    )
+    TIMELINES: ClassVar[tuple[type[Widget], ...]] = (
+        RuledVerticalTimeline,
+        RuledHorizontalTimeline,
+    )
+
     def compose(self) -> ComposeResult:
         """Generate the main layout for the demo app."""
         yield Header(show_clock=True)
@@ -251,90 +341,65 @@ class TimepieceDemo(App[None]):
                 TabPane("Pickers", id="pickers"),
                 Container(id="Pickers", classes="previews"),
             ):
-                for item in (
-                    DatePicker,
-                    DurationPicker,
-                    TimePicker,
-                    DateTimePicker,
-                    DateRangePicker,
-                    DateTimeRangePicker,
-                    DateTimeDurationPicker,
-                ):
+                for item in self.PICKERS:
                     yield DemoWidget(item)
 
             with (
                 TabPane("Select"),
                 Container(id="Pickers", classes="previews"),
             ):
-                for select in (
-                    DateSelect,
-                    TimeSelect,
-                    DurationSelect,
-                ):
+                for select in self.SELECTS:
                     yield DemoWidget(select)
 
             with (
                 TabPane("Heatmap"),
                 Container(id="heatmap", classes="previews"),
             ):
-                for i in (ActivityHeatmap, HeatmapManager):
+                for i in self.HEATMAPS:
                     yield DemoWidget(i)
 
             with (
                 TabPane("Timeline"),
                 Container(id="timeline", classes="previews"),
             ):
-                for timeline in (
-                    RuledVerticalTimeline,
-                    RuledHorizontalTimeline,
-                ):
+                for timeline in self.TIMELINES:
                     yield DemoWidget(timeline)
 
         yield Footer()
 
     def _on_mount(self, event: Mount) -> None:
+        self._year_timers: dict[ActivityHeatmap, Timer] = {}
         for widget in self.query(ActivityHeatmap):
             self._set_data(widget)
+        self._load_sources()
+
+    @work(name="sources", thread=True, exit_on_error=False)
+    def _load_sources(self) -> None:
+        """Read the widget sources up front, so previews open instantly."""
+        for widget in chain(
+            self.PICKERS, self.SELECTS, self.HEATMAPS, self.TIMELINES
+        ):
+            _render_preview(widget, "code")
 
     @on(DemoWidget.Toggle)
     def _open_tab(self, message: DemoWidget.Toggle) -> None:
-        data: RenderableType
-        if message.preview == "tcss":
-            data = message.widget.DEFAULT_CSS
-
-        elif message.preview == "bindings":
-            data = Pretty(message.widget.BINDINGS)
-
-        elif message.preview == "docstring":
-            data = str(message.widget.__doc__)
-
-        elif message.preview == "code":
-            data = Syntax(
-                inspect.getsource(message.widget),
-                "python",
-                line_numbers=True,
-                padding=1,
-            )
-
-        self.app.push_screen(PreviewScreen(data))
+        screen = self.get_screen("preview", PreviewScreen)
+        screen.set_renderable(_render_preview(message.widget, message.preview))
+        self.push_screen(screen)
 
     def _set_data(self, widget: ActivityHeatmap) -> None:
-        random.seed(widget.year)
-        template = ActivityHeatmap.generate_empty_activity(widget.year)
-        widget.values = defaultdict(
-            lambda: 0,
-            {
-                day: random.randint(6000, 20000)  # noqa: S311
-                for week in template
-                for day in week
-                if day
-            },
-        )
+        widget.values = _fake_activity(widget.year)
 
     @on(HeatmapManager.YearChanged)
     def _change_heat_year(self, message: HeatmapManager.YearChanged) -> None:
         message.stop()
-        self._set_data(message.widget.heatmap)
+        heatmap = message.widget.heatmap
+        if (timer := self._year_timers.pop(heatmap, None)) is not None:
+            timer.stop()
+
+        self._year_timers[heatmap] = self.set_timer(
+            self.YEAR_DEBOUNCE, partial(self._set_data, heatmap)
+        )
 
     @cached_property
     def preview_panel(self) -> Static:
@@ -1,19 +1,57 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import sys
-from functools import cached_property
+from bisect import bisect_right
+from itertools import accumulate
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
 from typing import ClassVar
 from typing import Generic
 from typing import Iterator
 from typing import TypeVar
+from typing import overload
 
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
     from typing_extensions import Self
 
+if sys.version_info >= (3, 12):
+    from functools import cached_property as cached_property
+else:
+    T = TypeVar("T")
+
+    class cached_property(Generic[T]):  # noqa: N801
+        """Lock free stand in for `functools.cached_property`.
+
+        Before 3.12 the standard library version acquires a lock on every
+        first access, which widgets bound to a single event loop never need.
+        """
+
+        def __init__(self, func: Callable[[Any], T]) -> None:
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __set_name__(self, owner: type[Any], name: str) -> None:
+            self.attrname = name
+
+        @overload
+        def __get__(self, instance: None, owner: type[Any]) -> Self: ...
+
+        @overload
+        def __get__(self, instance: object, owner: type[Any]) -> T: ...
+
+        def __get__(self, instance: object, owner: type[Any]) -> T | Self:
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
+
 from rich.text import Text
 from textual.dom import DOMNode
 from textual.message import Message
@@ -21,6 +59,7 @@ from textual.reactive import reactive
 from textual.reactive import var
 from textual.widget import Widget
 from textual.widgets import Button
+from whenever import Instant
 
 from textual_timepiece.constants import LOCKED_ICON
 from textual_timepiece.constants import TARGET_ICON
@@ -30,42 +69,87 @@ if TYPE_CHECKING:
     from rich.console import RenderableType
     from textual.app import RenderResult
     from textual.geometry import Offset
+    from whenever import Date
+    from whenever import PlainDateTime
 
 
 class BaseWidget(Widget):
     """Base class with a bunch of utility methods."""
 
+    _cached_property_names: ClassVar[tuple[str, ...]]
+    """Names of cached properties, collected once per class."""
+
+    _today_cache: tuple[Instant, Instant, Date] | None = None
+
     async def recompose(self) -> None:
         self.clear_cached_properties()
         await super().recompose()
 
     def clear_cached_properties(self) -> None:
+        attributes = self.__dict__
         for prop in self.get_cached_properties():
-            if hasattr(self, prop):
-                delattr(self, prop)
+            attributes.pop(prop, None)
 
     @classmethod
     def get_cached_properties(cls) -> Iterator[str]:
-        for n, v in inspect.getmembers(cls):
-            if isinstance(v, cached_property):
-                yield n
+        if (names := cls.__dict__.get("_cached_property_names")) is None:
+            names = cls._cached_property_names = tuple(
+                n
+                for n, v in inspect.getmembers(cls)
+                if isinstance(v, (cached_property, functools.cached_property))
+            )
+        return iter(names)
+
+    @staticmethod
+    def _today() -> Date:
+        """Current date in the system timezone, looked up once per day.
+
+        The cache is shared between all widgets so it can also serve as a
+        reactive default.
+        """
+        # NOTE: Checked against the wall clock, as a monotonic clock stops
+        # during suspend and the day can be 23 or 25 hours long.
+        now = Instant.now()
+        cache = BaseWidget._today_cache
+        if cache is None or not cache[0] <= now < cache[1]:
+            current = now.to_system_tz()
+            cache = BaseWidget._today_cache = (
+                current.start_of_day().to_instant(),
+                current.add(days=1, disambiguate="compatible")
+                .start_of_day()
+                .to_instant(),
+                current.date(),
+            )
+        return cache[2]
+
+    def _now(self) -> PlainDateTime:
+        """Current datetime in the system timezone without the offset."""
+        return Instant.now().to_system_tz().to_plain()
 
     def get_line_offset(self, offset: Offset) -> str:
-        x = offset.x - int(self.styles.border_left[0] != "")
-        index = 0
-
-        for seg in self.render_line(
+        x = offset.x - self._border_offsets[0]
+        # REFACTOR: Look for a public method for this.
+        segments = self.render_line(
             offset.y - self._top_border_offset()
-        )._segments:
-            # REFACTOR: Look for a public method for this.
-            index += len(seg.text)
-            if index > x:
-                return str(seg.text.strip())
+        )._segments
+        ends = list(accumulate(len(seg.text) for seg in segments))
+
+        if (index := bisect_right(ends, x)) < len(segments):
+            return str(segments[index].text.strip())
 
         return ""
 
     def _top_border_offset(self) -> int:
-        return int(self.styles.border_top[0] != "")
+        return self._border_offsets[1]
+
+    @property
+    def _border_offsets(self) -> tuple[int, int]:
+        """Left and top border widths."""
+        styles = self.styles
+        return (
+            int(styles.border_left[0] != ""),
+            int(styles.border_top[0] != ""),
+        )
 
     def disable(self, *, disable: bool = True) -> Self:
         self.disabled = disable
@@ -105,8 +189,10 @@ class LockButton(Button, BaseWidget):
     }
     """
 
-    locked = var[bool](False, init=False)
-    icon = reactive[Text](Text(LOCKED_ICON), init=False)
+    ICONS: ClassVar[tuple[str, str]] = (UNLOCKED_ICON, LOCKED_ICON)
+    """Icons for the unlocked and locked states."""
+
+    locked = reactive[bool](False, init=False)
 
     def __init__(
         self,
@@ -131,14 +217,8 @@ class LockButton(Button, BaseWidget):
         )
         self.locked = is_locked
 
-    def compute_icon(self) -> Text:
-        return Text(
-            LOCKED_ICON if self.locked else UNLOCKED_ICON,
-            self.rich_style,
-        )
-
     def render(self) -> RenderResult:
-        return self.icon
+        return Text(self.ICONS[self.locked], self.rich_style)
 
     def press(self) -> Self:
         self.locked = not self.locked
@@ -163,6 +243,9 @@ class ExpandButton(Button):
     }
     """
 
+    ICONS: ClassVar[tuple[str, str]] = ("▼", "▲")
+    """Icons for the collapsed and expanded states."""
+
     expanded = var[bool](False, init=False)
 
     def __init__(
@@ -185,7 +268,7 @@ class ExpandButton(Button):
         )
 
     def render(self) -> RenderResult:
-        return Text("▲" if self.expanded else "▼", self.rich_style)
+        return Text(self.ICONS[self.expanded], self.rich_style)
 
 
 class TargetButton(Button):
@@ -218,6 +301,8 @@ WidgetType = TypeVar("WidgetType", bound=DOMNode)
 class BaseMessage(Message, Generic[WidgetType]):
     """Generic message that overrides the control method."""
 
+    __slots__ = ("widget",)
+
     def __init__(self, widget: WidgetType) -> None:
         super().__init__()
         self.widget = widget
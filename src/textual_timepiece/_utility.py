@@ -3,9 +3,7 @@
 from __future__ import annotations
 
 import enum
-import math
-from calendar import Calendar
-from calendar import month_name
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Iterator
@@ -21,6 +19,9 @@ from whenever import TimeDelta
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+DIGITS: frozenset[str] = frozenset("0123456789")
+"""ASCII digits accepted by the masked inputs."""
+
 
 def breakdown_seconds(total_seconds: int) -> tuple[int, int, int]:
     """Breakdown total seconds into hours, minutes and seconds.
@@ -77,7 +78,18 @@ class DateScope(enum.Enum):
 Scope: TypeAlias = list[list[int]] | list[list[str]]
 
 
+@lru_cache(maxsize=128)
+def _get_month_scope(year: int, month: int) -> list[list[int]]:
+    # NOTE: Deferred so the time pickers don't pay for importing calendar.
+    from calendar import Calendar
+
+    return Calendar().monthdayscalendar(year, month)
+
+
+@lru_cache(maxsize=1)
 def _get_year_scope() -> list[list[str]]:
+    from calendar import month_name
+
     year_scope: list[list[str]] = []
     month_names = list(month_name)[1:]
     for i in range(4):
@@ -86,9 +98,9 @@ def _get_year_scope() -> list[list[str]]:
     return year_scope
 
 
-def _get_decade_scope(period: Date) -> list[list[int]]:
+@lru_cache(maxsize=32)
+def _get_decade_scope(year: int) -> list[list[int]]:
     data: list[list[int]] = []
-    year = math.floor(period.year / 10) * 10
     for i, y in enumerate(range(year, year + 10)):
         if i % 3 == 0:
             data.append([])
@@ -96,9 +108,9 @@ def _get_decade_scope(period: Date) -> list[list[int]]:
     return data
 
 
-def _get_century_scopee(period: Date) -> list[list[int]]:
+@lru_cache(maxsize=32)
+def _get_century_scopee(century: int) -> list[list[int]]:
     data: list[list[int]] = []
-    century = math.floor(period.year / 100) * 100
     for i, year in enumerate(range(century, century + 100, 10)):
         if i % 3 == 0:
             data.append([])
@@ -117,16 +129,17 @@ def get_scope(scope: DateScope, period: Date) -> Scope:
         NotImplementedError: If the wrong date scope is supplied.
 
     Returns:
-        The range of times in a two dimensional array.
+        The range of times in a two dimensional array. Arrays are cached and
+            shared between calls so they should not be mutated.
     """
     if scope == DateScope.MONTH:
-        return Calendar().monthdayscalendar(period.year, period.month)
+        return _get_month_scope(period.year, period.month)
     if scope == DateScope.YEAR:
         return _get_year_scope()
     if scope == DateScope.DECADE:
-        return _get_decade_scope(period)
+        return _get_decade_scope(period.year // 10 * 10)
     if scope == DateScope.CENTURY:
-        return _get_century_scopee(period)
+        return _get_century_scopee(period.year // 100 * 100)
 
     raise NotImplementedError(f"{scope.name} scope is not implemented!")
 
@@ -156,27 +169,14 @@ def iterate_timespan(
             return
 
 
-def _nomalize_value(
-    value: float | None, min_val: float, denom: float
-) -> float | None:
-    if value is None:
-        return None
-    try:
-        return (value - min_val) / denom
-    except ZeroDivisionError:
-        return 0
-
-
 def normalize_values(values: Sequence[float | None]) -> list[float | None]:
     """Normalizes an sequence of values to the range of 0 to 1."""
-    min_val, max_val = (
-        min(v for v in values if v is not None),
-        max(v for v in values if v is not None),
-    )
-    denom = max_val - min_val
-    return [
-        _nomalize_value(values[i], min_val, denom) for i in range(len(values))
-    ]
+    present = [v for v in values if v is not None]
+    min_val, max_val = min(present), max(present)
+    if not (denom := max_val - min_val):
+        return [None if v is None else 0.0 for v in values]
+
+    return [None if v is None else (v - min_val) / denom for v in values]
 
 
 T = TypeVar("T")
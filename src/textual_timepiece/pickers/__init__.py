@@ -2,26 +2,31 @@
 
 from __future__ import annotations
 
-from ._date_picker import DateInput
-from ._date_picker import DateOverlay
-from ._date_picker import DatePicker
-from ._date_picker import DateSelect
-from ._date_picker import EndDateOverlay
-from ._date_picker import EndDateSelect
-from ._datetime_picker import DateTimeInput
-from ._datetime_picker import DateTimeOverlay
-from ._datetime_picker import DateTimePicker
-from ._time_picker import DurationInput
-from ._time_picker import DurationOverlay
-from ._time_picker import DurationPicker
-from ._time_picker import DurationSelect
-from ._time_picker import TimeInput
-from ._time_picker import TimeOverlay
-from ._time_picker import TimePicker
-from ._time_picker import TimeSelect
-from ._timerange_picker import DateRangePicker
-from ._timerange_picker import DateTimeDurationPicker
-from ._timerange_picker import DateTimeRangePicker
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from ._date_picker import DateInput
+    from ._date_picker import DateOverlay
+    from ._date_picker import DatePicker
+    from ._date_picker import DateSelect
+    from ._date_picker import EndDateOverlay
+    from ._date_picker import EndDateSelect
+    from ._datetime_picker import DateTimeInput
+    from ._datetime_picker import DateTimeOverlay
+    from ._datetime_picker import DateTimePicker
+    from ._time_picker import DurationInput
+    from ._time_picker import DurationOverlay
+    from ._time_picker import DurationPicker
+    from ._time_picker import DurationSelect
+    from ._time_picker import TimeInput
+    from ._time_picker import TimeOverlay
+    from ._time_picker import TimePicker
+    from ._time_picker import TimeSelect
+    from ._timerange_picker import DateRangePicker
+    from ._timerange_picker import DateTimeDurationPicker
+    from ._timerange_picker import DateTimeRangePicker
 
 __all__ = [
     "DateInput",
@@ -45,3 +50,43 @@ __all__ = [
     "TimePicker",
     "TimeSelect",
 ]
+
+
+_MODULES: dict[str, str] = {
+    "DateInput": "._date_picker",
+    "DateOverlay": "._date_picker",
+    "DatePicker": "._date_picker",
+    "DateSelect": "._date_picker",
+    "EndDateOverlay": "._date_picker",
+    "EndDateSelect": "._date_picker",
+    "DateTimeInput": "._datetime_picker",
+    "DateTimeOverlay": "._datetime_picker",
+    "DateTimePicker": "._datetime_picker",
+    "DurationInput": "._time_picker",
+    "DurationOverlay": "._time_picker",
+    "DurationPicker": "._time_picker",
+    "DurationSelect": "._time_picker",
+    "TimeInput": "._time_picker",
+    "TimeOverlay": "._time_picker",
+    "TimePicker": "._time_picker",
+    "TimeSelect": "._time_picker",
+    "DateRangePicker": "._timerange_picker",
+    "DateTimeDurationPicker": "._timerange_picker",
+    "DateTimeRangePicker": "._timerange_picker",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
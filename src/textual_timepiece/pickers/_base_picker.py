@@ -1,11 +1,9 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from functools import cached_property
+from operator import attrgetter
 from typing import TYPE_CHECKING
 from typing import Any
-from typing import Awaitable
-from typing import Callable
 from typing import ClassVar
 from typing import Generic
 from typing import TypeVar
@@ -17,6 +15,7 @@ from textual.binding import BindingType
 from textual.events import DescendantBlur
 from textual.events import MouseDown
 from textual.events import MouseMove
+from textual.events import MouseRelease
 from textual.events import MouseScrollDown
 from textual.events import MouseScrollUp
 from textual.events import MouseUp
@@ -31,8 +30,10 @@ from textual.widgets import MaskedInput
 from textual_timepiece._extra import BaseMessage
 from textual_timepiece._extra import BaseWidget
 from textual_timepiece._extra import ExpandButton
+from textual_timepiece._extra import cached_property
 
 if TYPE_CHECKING:
+    from textual.message import Message
     from textual.widget import Widget
 
 
@@ -93,6 +94,9 @@ class BaseOverlay(BaseWidget, can_focus=True):
         Binding("escape", "close_dialog", "Close dialog."),
     ]
 
+    FAST_TOGGLE: ClassVar[bool] = False
+    """Skip the fade and toggle the overlay instantly."""
+
     show = var[bool](False, init=False)
 
     def __init__(
@@ -111,39 +115,63 @@ class BaseOverlay(BaseWidget, can_focus=True):
         )
 
         self.display = False
+        self._animation_pending = False
+        self._resize_key: tuple[int, int, int, bool] | None = None
 
     def action_close_dialog(self) -> None:
         self.post_message(self.Closed(self))
 
     def watch_show(self, show: bool) -> None:
-        def anim(
-            on_complete: Callable[[], Awaitable[None]]
-            | Callable[[], None]
-            | None,
-        ) -> None:
-            self.styles.animate(
-                "opacity",
-                1 if show else 0,
-                duration=0.4,
-                easing="in_out_expo",
-                on_complete=on_complete,
-            )
-
-        if show:
-            self.display = show
-            anim(self.notify_style_update)
-        else:
-            anim(lambda: setattr(self, "display", show))
+        with self.app.batch_update():
+            if show:
+                self.display = show
+
+            self.set_class(show, "-expanded")
+
+        # NOTE: Rapid toggles share one animation that targets the last state.
+        if not self._animation_pending:
+            self._animation_pending = True
+            self.call_later(self._animate_show)
+
+    def _animate_show(self) -> None:
+        self._animation_pending = False
+        if self.FAST_TOGGLE or self.app.animation_level == "none":
+            self.styles.opacity = 1 if self.show else 0
+            self._on_show_complete()
+            return
+
+        self.styles.animate(
+            "opacity",
+            1 if self.show else 0,
+            duration=0.4,
+            easing="in_out_expo",
+            on_complete=self._on_show_complete,
+        )
 
-        self.set_class(show, "-expanded")
+    def _on_show_complete(self) -> None:
+        if self.show:
+            self.notify_style_update()
+        else:
+            self.display = False
 
     def on_resize(self, event: Resize) -> None:
         # TODO: Need a better way to calculate this.
         # NOTE: Might have to set a constant height in a class var
         parent = cast("Widget", self.parent)
-        offset = 1 if parent.has_class("mini") else 3
-        bottom = self.app.size.height // 2 > parent.region.y
-        self.offset = Offset(0, offset if bottom else -(self.size.height + 2))
+        key = (
+            self.size.height,
+            parent.region.y,
+            self.app.size.height,
+            parent.has_class("mini"),
+        )
+        if key == self._resize_key:
+            return
+
+        self._resize_key = key
+        height, parent_y, app_height, mini = key
+        offset = 1 if mini else 3
+        bottom = app_height // 2 > parent_y
+        self.offset = Offset(0, offset if bottom else -(height + 2))
 
     def on_focus(self) -> None:
         self.app.action_focus_next()
@@ -225,6 +253,13 @@ class AbstractInput(
     ALIAS: ClassVar[str]
     PATTERN: ClassVar[str]
 
+    _alias_getter: ClassVar[attrgetter[Any]]
+
+    _DISABLED_MESSAGES: ClassVar[frozenset[type[Message]]] = frozenset(
+        {Input.Changed, Input.Submitted, Input.Blurred}
+    )
+    """Default input messages replaced by the typed `Updated` messages."""
+
     def __init__(
         self,
         value: ValueType | None = None,
@@ -251,7 +286,16 @@ class AbstractInput(
         )
         self.alias = value
         self._sbox_sensitivity = max(1, spinbox_sensitivity)
-        self.disable_messages(Input.Changed, Input.Submitted, Input.Blurred)
+        self._pending_adjustment = 0
+        self._adjustment_scheduled = False
+        self._dragging = False
+        self.disable_messages(*self._DISABLED_MESSAGES)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # NOTE: Bind the aliased attribute once instead of on every access.
+        if (alias := getattr(cls, "ALIAS", None)) is not None:
+            cls._alias_getter = attrgetter(alias)
 
     def watch_updated(self, value: bool) -> None:
         self.set_class(value, "updated")
@@ -264,24 +308,42 @@ class AbstractInput(
 
     async def _on_mouse_down(self, event: MouseDown) -> None:
         if not self.app.mouse_captured:
+            self._dragging = True
             self.capture_mouse()
 
     async def _on_mouse_move(self, event: MouseMove) -> None:
-        if self.app.mouse_captured == self:
-            self.action_adjust_time(-event.delta_y * self._sbox_sensitivity)
+        if self._dragging:
+            self._queue_adjustment(-event.delta_y * self._sbox_sensitivity)
+
+    def _queue_adjustment(self, value: int) -> None:
+        """Accumulate spinbox adjustments and apply them once per batch."""
+        self._pending_adjustment += value
+        if not self._adjustment_scheduled:
+            self._adjustment_scheduled = True
+            self.call_later(self._apply_adjustment)
+
+    def _apply_adjustment(self) -> None:
+        self._adjustment_scheduled = False
+        value, self._pending_adjustment = self._pending_adjustment, 0
+        if value:
+            self.action_adjust_time(value)
 
     async def _on_mouse_up(self, event: MouseUp) -> None:
-        if self.app.mouse_captured == self:
+        if self._dragging:
+            self._dragging = False
             self.capture_mouse(False)
 
+    async def _on_mouse_release(self, event: MouseRelease) -> None:
+        self._dragging = False
+
     def _on_mouse_scroll_up(self, event: MouseScrollUp) -> None:
         if self.has_focus:
-            self.action_adjust_time(1 * self._sbox_sensitivity)
+            self._queue_adjustment(self._sbox_sensitivity)
             event.stop()
 
     def _on_mouse_scroll_down(self, event: MouseScrollDown) -> None:
         if self.has_focus:
-            self.action_adjust_time(-1 * self._sbox_sensitivity)
+            self._queue_adjustment(-self._sbox_sensitivity)
             event.stop()
 
     @abstractmethod
@@ -293,7 +355,7 @@ class AbstractInput(
     @property
     def alias(self) -> ValueType | None:
         """Alias for whatever value the input may be holding."""
-        return cast("ValueType | None", getattr(self, self.ALIAS))
+        return cast("ValueType | None", self._alias_getter(self))
 
     @alias.setter
     def alias(self, value: ValueType | None) -> None:
@@ -446,12 +508,12 @@ class AbstractPicker(BaseWidget, Generic[Overlay]):
 
     @on(DescendantBlur)
     def close_overlay(self) -> None:
-        if not self.has_focus_within:
+        if self.expanded and not self.has_focus_within:
             self.expanded = False
 
     def _watch_expanded(self, expanded: bool) -> None:
         if expanded:
-            self.query_one(BaseOverlay).focus()
+            self.overlay.focus()
 
     @cached_property
     def overlay(self) -> Overlay:
@@ -467,6 +529,8 @@ class BasePicker(AbstractPicker[Any], Generic[InputType, ValueType, Overlay]):
     ALIAS: str
     INPUT: type[InputType]
 
+    _input_widget: InputType
+
     BINDINGS: ClassVar[list[BindingType]] = [
         Binding(
             "ctrl+shift+d",
@@ -524,9 +588,18 @@ class BasePicker(AbstractPicker[Any], Generic[InputType, ValueType, Overlay]):
     def to_default(self) -> None:
         """Behaviour when using the target-default button or action."""
 
-    @cached_property
+    def _compose_input(self, widget: InputType) -> InputType:
+        self._input_widget = widget
+        return widget
+
+    @property
     def input_widget(self) -> InputType:
-        return self.query_exactly_one(self.INPUT)
+        """Input widget holding the value, stored when composing."""
+        return self._input_widget
+
+    @cached_property
+    def _target_button(self) -> Button:
+        return self.query_exactly_one("#target-default", Button)
 
     @property
     def value(self) -> ValueType | None:
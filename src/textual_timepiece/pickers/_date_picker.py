@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-import math
 from calendar import day_abbr
 from calendar import month_name
 from collections.abc import Callable
 from contextlib import suppress
 from datetime import datetime
-from functools import cached_property
 from typing import TYPE_CHECKING
 from typing import ClassVar
 from typing import NamedTuple
@@ -20,17 +18,20 @@ from textual.binding import Binding
 from textual.binding import BindingType
 from textual.containers import Horizontal
 from textual.geometry import Offset
+from textual.geometry import Region
 from textual.geometry import Size
 from textual.reactive import reactive
 from textual.reactive import var
 from textual.strip import Strip
-from textual.widgets import Button
 from textual.widgets import Input
 from whenever import Date
 from whenever import DateDelta
 
 from textual_timepiece._extra import BaseMessage
+from textual_timepiece._extra import BaseWidget
 from textual_timepiece._extra import TargetButton
+from textual_timepiece._extra import cached_property
+from textual_timepiece._utility import DIGITS
 from textual_timepiece._utility import DateScope
 from textual_timepiece._utility import Scope
 from textual_timepiece._utility import get_scope
@@ -55,10 +56,11 @@ if TYPE_CHECKING:
 
 DisplayData: TypeAlias = Scope
 
+_MONTH_INDEX = {name: i for i, name in enumerate(month_name) if i}
+
 
 # TODO: Month and year picker
 # TODO: Week and year picker
-# PERF: Region refreshing
 
 
 class DateCursor(NamedTuple):
@@ -71,11 +73,31 @@ class DateCursor(NamedTuple):
         """Confines cursor to the current display data size."""
         y = min(len(data) + 1, self.y)
         x = min(len(data[y - 1]) - 1 if y else 3, max(self.x, 0))
+        if y == self.y and x == self.x:
+            return self
         return DateCursor(y, x)
 
     def replace(self, **kwargs: int) -> DateCursor:
         """Create a new cursor with the supplied kwargs."""
-        return self._replace(**kwargs)
+        # NOTE: Direct construction skips the generic `_replace` machinery.
+        return DateCursor(kwargs.get("y", self.y), kwargs.get("x", self.x))
+
+
+class _DateSelectStyles(NamedTuple):
+    base: Style
+    primary: Style
+    secondary: Style
+    start: Style
+    end: Style
+    range: Style
+    hovered: Style
+    cursor: Style
+    combined: dict[tuple[bool, bool, bool, bool, bool], Style]
+    """Combined styles keyed by which of the date states matched."""
+    weekdays: Strip
+    """Weekday label row of the month view."""
+    blanks: dict[int, Strip]
+    """Blank rows keyed by their width."""
 
 
 class DateSelect(BaseOverlayWidget):
@@ -243,7 +265,7 @@ class DateSelect(BaseOverlayWidget):
     scope = var[DateScope](DateScope.MONTH)
     """Scope of the current date picker view."""
 
-    loc = reactive[Date](Date.today_in_system_tz, init=False)
+    loc = reactive[Date](BaseWidget._today, init=False)
     """Current location of the date picker for navigation."""
 
     data = reactive[DisplayData](list, init=False, layout=True)
@@ -255,11 +277,22 @@ class DateSelect(BaseOverlayWidget):
     header = reactive[str]("", init=False)
     """Navigation date header is computed dynamically."""
 
-    cursor_offset = reactive[Offset | None](None, init=False)
-    """Mouse cursor position for mouse navigation."""
+    cursor_offset = var[Offset | None](None, init=False)
+    """Mouse cursor position for mouse navigation.
+
+    Only the rows that gain or lose the hover are refreshed.
+    """
+
+    cursor = var[DateCursor | None](None, init=False)
+    """Keyboard cursor position.
+
+    Only the rows the cursor leaves and enters are refreshed.
+    """
 
-    cursor = reactive[DateCursor | None](None, init=False)
-    """Keyboard cursor position."""
+    _header_cache: tuple[tuple[str, int], tuple[int, int, int, int, int]] = (
+        ("", -1),
+        (0, 0, 0, 0, 0),
+    )
 
     def __init__(
         self,
@@ -278,6 +311,8 @@ class DateSelect(BaseOverlayWidget):
         self._is_range = is_range or bool(end) or bool(date_range)
 
         self._select_on_focus = select_on_focus
+        self._max_render_y = 0
+        self._labels: list[list[str]] = []
 
         self.set_reactive(DateSelect.date, start)
         self.set_reactive(DateSelect.end_date, end)
@@ -288,11 +323,11 @@ class DateSelect(BaseOverlayWidget):
             return str(self.loc.year)
 
         if self.scope == DateScope.DECADE:
-            start = math.floor(self.loc.year / 10) * 10
+            start = self.loc.year // 10 * 10
             return f"{start} <-> {start + 9}"
 
         if self.scope == DateScope.CENTURY:
-            start = math.floor(self.loc.year / 100) * 100
+            start = self.loc.year // 100 * 100
             return f"{start} <-> {start + 99}"
 
         return f"{month_name[self.loc.month]} {self.loc.year}"
@@ -320,12 +355,40 @@ class DateSelect(BaseOverlayWidget):
             self._find_move()
 
     def _watch_date(self, date: Date | None) -> None:
-        self.scope = DateScope.MONTH
         if date:
             if self.date_range:
                 self.end_date = date.add(self.date_range)
 
-            self.loc = date
+            self._show_month(date)
+        else:
+            self.scope = DateScope.MONTH
+
+    def _show_month(self, loc: Date) -> None:
+        """Switch to the month view of `loc`, building its data only once."""
+        if self.scope == DateScope.MONTH and self.loc == loc:
+            return
+
+        self.set_reactive(DateSelect.scope, DateScope.MONTH)
+        self.set_reactive(DateSelect.loc, loc)
+        self.data = get_scope(DateScope.MONTH, loc)
+
+        if self.cursor:
+            self.cursor = self.cursor.confine(self.data)
+
+    def _watch_data(self, data: DisplayData) -> None:
+        self._max_render_y = (len(data) + 2) * 2 if data else 0
+        if self.scope == DateScope.CENTURY:
+            self._labels = [
+                [f"{value}-{cast('int', value) + 9}" for value in row]
+                for row in data
+            ]
+        elif self.scope == DateScope.MONTH:
+            self._labels = [
+                [str(day).rjust(3) if day else "   " for day in week]
+                for week in data
+            ]
+        else:
+            self._labels = [[str(value) for value in row] for row in data]
 
     def _watch_loc(self, loc: Date) -> None:
         self.data = get_scope(self.scope, loc)
@@ -333,8 +396,43 @@ class DateSelect(BaseOverlayWidget):
         if self.cursor:
             self.cursor = self.cursor.confine(self.data)
 
+    def _watch_cursor_offset(
+        self,
+        old: Offset | None,
+        new: Offset | None,
+    ) -> None:
+        border_offset = self._top_border_offset()
+        for offset in {old, new}:
+            if offset is not None:
+                self.refresh_line(offset.y - border_offset)
+
+    def _watch_cursor(
+        self,
+        old: DateCursor | None,
+        new: DateCursor | None,
+    ) -> None:
+        month = self.scope == DateScope.MONTH
+        for cursor in {old, new}:
+            if cursor is None:
+                continue
+            if not cursor.y:
+                self.refresh_line(1)
+            else:
+                # NOTE: Month rows sit below an extra weekday row.
+                self.refresh_line(cursor.y * 2 + (3 if month else 1))
+
+    def refresh_line(self, y: int) -> None:
+        """Refresh a single line.
+
+        Args:
+            y: Coordinate of line.
+        """
+        self.refresh(Region(0, y, self.size.width, 1))
+
     async def _on_mouse_move(self, event: MouseMove) -> None:
-        self.cursor_offset = event.offset
+        # NOTE: Skips the reactive machinery for repeated offsets.
+        if event.offset != self.cursor_offset:
+            self.cursor_offset = event.offset
 
     def _on_leave(self, event: Leave) -> None:
         self.cursor_offset = None
@@ -386,7 +484,7 @@ class DateSelect(BaseOverlayWidget):
             new_x = cursor.x + x
             if cursor.y != 0:
                 # NOTE: Making sure different row lengths align.
-                new_x = math.ceil(((cursor.x) / len(self.data[0])) * 3)
+                new_x = -(-cursor.x * 3 // len(self.data[0]))
 
             self.cursor = cursor.replace(y=new_y, x=new_x).confine(self.data)
 
@@ -394,7 +492,7 @@ class DateSelect(BaseOverlayWidget):
             new_x = cursor.x
             if cursor.y == 0:
                 # NOTE: Making sure different row lengths align.
-                new_x = math.ceil(((cursor.x) / 3) * len(self.data[0]))
+                new_x = -(-cursor.x * len(self.data[0]) // 3)
 
             self.cursor = cursor.replace(y=new_y, x=new_x).confine(self.data)
 
@@ -413,16 +511,14 @@ class DateSelect(BaseOverlayWidget):
             self.post_message(self.StartChanged(self, date))
 
     def _set_month(self, target: str) -> None:
-        try:
-            month_no = list(month_name).index(target)
-        except IndexError:
+        if (month_no := _MONTH_INDEX.get(target)) is None:
             return
-        else:
-            self.set_reactive(
-                DateSelect.loc,
-                Date(self.loc.year, month_no, self.loc.day),
-            )
-            self.scope = DateScope.MONTH
+
+        self.set_reactive(
+            DateSelect.loc,
+            Date(self.loc.year, month_no, self.loc.day),
+        )
+        self.scope = DateScope.MONTH
 
     def _set_years(self, target: str | int) -> None:
         if self.scope == DateScope.CENTURY and isinstance(target, str):
@@ -481,8 +577,7 @@ class DateSelect(BaseOverlayWidget):
             self._set_target(target, ctrl=ctrl and self._is_range)
 
     def _set_current_scope(self) -> None:
-        self.scope = DateScope.MONTH
-        self.loc = self.date or self.end_date or Date.today_in_system_tz()
+        self._show_month(self.date or self.end_date or self._today())
 
     def _crement_scope(self, value: int) -> None:
         with suppress(ValueError):  # NOTE: Preventing out of range values.
@@ -498,54 +593,52 @@ class DateSelect(BaseOverlayWidget):
     def _filter_style(
         self,
         y: int,
-        x: range,
-        date: Date | None = None,
+        x_start: int,
+        x_end: int,
         log_idx: DateCursor | None = None,
+        *,
+        is_start: bool = False,
+        is_end: bool = False,
+        in_range: bool = False,
     ) -> Style:
         """Filters a rich style based on location data.
 
         Args:
             y: Current row being rendered.
-            x: Range of indexes to target.
-            date: If a date is being filtered.
+            x_start: First column to target.
+            x_end: Column after the last one to target.
             log_idx: Logical index for rendering the keyboard cursor.
+            is_start: If the target is the selected start date.
+            is_end: If the target is the selected end date.
+            in_range: If the target is within the selected range.
 
         Returns:
             Combined style with all the properties that matched.
         """
-        styles = [self.get_component_rich_style("dateselect--primary-date")]
-
-        if date:
-            if date == self.date:
-                styles.append(
-                    self.get_component_rich_style("dateselect--start-date")
-                )
-            elif date == self.end_date:
-                styles.append(
-                    self.get_component_rich_style("dateselect--end-date")
-                )
-
-            if self.is_day_in_range(date):
-                styles.append(
-                    self.get_component_rich_style(
-                        "dateselect--range-date"
-                    ).background_style
-                )
-
-        if (
-            self.cursor_offset
-            and self.cursor_offset.y == y
-            and self.cursor_offset.x in x
-        ):
-            style = self.get_component_rich_style("dateselect--hovered-date")
-            styles.append(style.from_color(style.color))
-
-        if self.cursor and self.cursor == log_idx:
-            styles.append(
-                self.get_component_rich_style("dateselect--cursor-date")
+        hovered = bool(
+            (offset := self.cursor_offset)
+            and offset.y == y
+            and x_start <= offset.x < x_end
+        )
+        at_cursor = bool(self.cursor and self.cursor == log_idx)
+        cache = self._styles
+        if not (is_start or is_end or in_range or hovered or at_cursor):
+            return cache.primary
+
+        key = (is_start, is_end, in_range, hovered, at_cursor)
+        if (style := cache.combined.get(key)) is None:
+            states = (
+                cache.start,
+                cache.end,
+                cache.range,
+                cache.hovered,
+                cache.cursor,
             )
-
-        return Style.combine(styles)
+            style = cache.combined[key] = Style.combine(
+                [cache.primary]
+                + [state for state, on in zip(states, key, strict=True) if on]
+            )
+        return style
 
     def is_day_in_range(self, day: Date) -> bool:
         """Checks if a given date is within selected the date range(inclusive).
@@ -563,110 +656,179 @@ class DateSelect(BaseOverlayWidget):
             and self.date <= day <= self.end_date
         )
 
-    def _render_header(self, y: int) -> list[Segment]:
-        header_len = len(self.header)
-        rem = self.size.width - (header_len + 10)
-        blank, blank_extra = divmod(rem, 2)
-        header_start = 5 + blank + blank_extra
-        header_end = header_start + header_len
-        right_nav_start = header_end + (blank - blank_extra) + len(TARGET_ICON)
+    def _header_layout(self) -> tuple[int, int, int, int, int]:
+        """Column layout of the navigation header.
 
-        y += self._top_border_offset()
+        Returns:
+            Blank width, extra blank, header start & end and the start of
+                the right navigation arrow.
+        """
+        key = (self.header, self.size.width)
+        if self._header_cache[0] != key:
+            header_len = len(self.header)
+            rem = self.size.width - (header_len + 10)
+            blank, blank_extra = divmod(rem, 2)
+            header_start = 5 + blank + blank_extra
+            header_end = header_start + header_len
+            right_nav_start = (
+                header_end + (blank - blank_extra) + len(TARGET_ICON)
+            )
+            self._header_cache = (
+                key,
+                (
+                    blank,
+                    blank_extra,
+                    header_start,
+                    header_end,
+                    right_nav_start,
+                ),
+            )
+        return self._header_cache[1]
+
+    def _render_header(self, y: int, top: int) -> list[Segment]:
+        blank, blank_extra, header_start, header_end, right_nav_start = (
+            self._header_layout()
+        )
+
+        y += top
+        base = self._styles.base
         return [
-            Segment("   ", self.rich_style),
+            Segment("   ", base),
             Segment(
                 LEFT_ARROW,
                 self._filter_style(
                     y,
-                    range(4, 5),
+                    4,
+                    5,
                     log_idx=DateCursor(0, 0),
                 ),
             ),
-            Segment(" " * (blank), self.rich_style),
+            Segment(" " * (blank), base),
             Segment(
                 self.header,
                 style=self._filter_style(
                     y,
-                    range(header_start, header_end),
+                    header_start,
+                    header_end,
                     log_idx=DateCursor(0, 1),
                 ),
             ),
-            Segment("   ", self.rich_style),
+            Segment("   ", base),
             Segment(
                 TARGET_ICON,
                 style=self._filter_style(
                     y,
-                    range(header_end + 1, header_end + 3),
+                    header_end + 1,
+                    header_end + 3,
                     log_idx=DateCursor(0, 2),
                 ),
             ),
-            Segment(" " * (blank - (3 - blank_extra)), self.rich_style),
+            Segment(" " * (blank - (3 - blank_extra)), base),
             Segment(
                 RIGHT_ARROW,
                 style=self._filter_style(
                     y,
-                    range(right_nav_start, right_nav_start + 2),
+                    right_nav_start,
+                    right_nav_start + 2,
                     log_idx=DateCursor(0, 3),
                 ),
             ),
         ]
 
-    def _render_weekdays(self) -> list[Segment]:
-        day_style = self.get_component_rich_style("dateselect--secondary-date")
-        empty = Segment("  ", style=self.rich_style)
-        segs = [Segment(" ", style=self.rich_style)]
+    @staticmethod
+    def _render_weekdays(base: Style, day_style: Style) -> Strip:
+        empty = Segment("  ", style=base)
+        segs = [Segment(" ", style=base)]
         for i in range(7):
             segs.append(empty)
             segs.append(Segment(day_abbr[i], day_style))
-        return segs
+        return Strip(segs)
 
-    def _render_month(self, y: int) -> list[Segment]:
-        border_offset = self._top_border_offset()
-        y += border_offset
-        if y == (3 + border_offset):
-            return self._render_weekdays()
+    def _month_bounds(self) -> tuple[int, int, int, int]:
+        """Locate the selection within the currently viewed month.
 
-        month = (y - (4 + border_offset)) // 2
+        Returns:
+            Start day, end day and the inclusive range of days that are
+                selected, with days outside of the month mapped to 0.
+        """
+        month = (self.loc.year, self.loc.month)
+        start_day = end_day = 0
+        low, high = 32, 0
+        if (start := self.date) and (start.year, start.month) == month:
+            start_day = start.day
+        if (end := self.end_date) and (end.year, end.month) == month:
+            end_day = end.day
+
+        if self._is_range and start and end:
+            start_month = (start.year, start.month)
+            end_month = (end.year, end.month)
+            if start_month <= month <= end_month:
+                low = start_day or 1
+                high = end_day or 31
+
+        return start_day, end_day, low, high
+
+    def _render_month(self, y: int, left: int, top: int) -> list[Segment]:
+        month = (y - 4) // 2
         # NOTE: Removing nav header + weekdays
-
-        date = None
-        segments = [Segment(" ", style=self.rich_style)]
-        subtotal = int(self.styles.border_left[0] != "")
+        y += top
+
+        start_day, end_day, low, high = self._month_bounds()
+        days, labels = self.data[month], self._labels[month]
+        # NOTE: Gaps take the flags of the day before them.
+        flags = (False, False, False)
+        segments = [Segment(" ", style=self._styles.base)]
+        subtotal = left
         for i in range(7):
+            is_start, is_end, in_range = flags
             segments.append(
                 Segment(
                     "  ",
                     self._filter_style(
                         y,
-                        range(subtotal, subtotal + 3),
-                        date=date,
+                        subtotal,
+                        subtotal + 3,
+                        is_start=is_start,
+                        is_end=is_end,
+                        in_range=in_range,
                     ),
                 )
             )
             subtotal += 2
-            if not (day := self.data[month][i]):
+            if not (day := cast("int", days[i])):
                 segments.append(
                     Segment(
-                        "   ",
+                        labels[i],
                         style=self._filter_style(
                             y,
-                            range(subtotal, subtotal + 4),
-                            date=date,
+                            subtotal,
+                            subtotal + 4,
                             log_idx=DateCursor(month + 1, i),
+                            is_start=is_start,
+                            is_end=is_end,
+                            in_range=in_range,
                         ),
                     )
                 )
-                date = None
+                flags = (False, False, False)
             else:
-                date = self.loc.replace(day=cast("int", day))
+                is_start = day == start_day
+                flags = (
+                    is_start,
+                    not is_start and day == end_day,
+                    low <= day <= high,
+                )
                 segments.append(
                     Segment(
-                        str(day).rjust(3),
+                        labels[i],
                         style=self._filter_style(
                             y,
-                            range(subtotal, subtotal + 4),
-                            date=date,
-                            log_idx=DateCursor(month + 1, i),
+                            subtotal,
+                            subtotal + 4,
+                            DateCursor(month + 1, i),
+                            is_start=flags[0],
+                            is_end=flags[1],
+                            in_range=flags[2],
                         ),
                     )
                 )
@@ -674,32 +836,28 @@ class DateSelect(BaseOverlayWidget):
 
         return segments
 
-    def _render_year(self, y: int) -> list[Segment]:
+    def _render_year(self, y: int, top: int) -> list[Segment]:
         if (row := (y - 2) // 2) > 3:
             return []
 
-        y += self._top_border_offset()
+        y += top
 
-        values = self.data[row]
+        values = self._labels[row]
         value_max_width = self.size.width // len(values)
 
         segs = list[Segment]()
         for i, value in enumerate(values):
-            if self.scope == DateScope.CENTURY:
-                value = f"{value}-{cast('int', value) + 9}"
-            else:
-                value = str(value)
             n = len(value)
             start = (i * value_max_width) + (abs(value_max_width - n) // 2)
             end = start + n + 1
 
-            value = value.center(value_max_width)
             segs.append(
                 Segment(
-                    value,
+                    value.center(value_max_width),
                     self._filter_style(
                         y,
-                        range(start, end),
+                        start,
+                        end,
                         log_idx=DateCursor(row + 1, i),
                     ),
                 )
@@ -708,18 +866,51 @@ class DateSelect(BaseOverlayWidget):
         return segs
 
     def render_line(self, y: int) -> Strip:
-        if (y % 2 == 0) or (len(self.data) + 2) * 2 < y or not self.data:
-            return Strip.blank(self.size.width, self.rich_style)
-
+        if not y & 1 or y > self._max_render_y:
+            styles = self._styles
+            width = self.size.width
+            if (blank := styles.blanks.get(width)) is None:
+                blank = styles.blanks[width] = Strip.blank(width, styles.base)
+            return blank
+
+        left, top = self._border_offsets
         if y == 1:
-            line = self._render_header(y)
+            line = self._render_header(y, top)
         elif self.scope == DateScope.MONTH:
-            line = self._render_month(y)
+            if y == 3:
+                return self._styles.weekdays
+
+            line = self._render_month(y, left, top)
         else:
-            line = self._render_year(y)
+            line = self._render_year(y, top)
 
         return Strip(line)
 
+    def notify_style_update(self) -> None:
+        self.__dict__.pop("_styles", None)
+        super().notify_style_update()
+
+    @cached_property
+    def _styles(self) -> _DateSelectStyles:
+        base = self.rich_style
+        secondary = self.get_component_rich_style("dateselect--secondary-date")
+        hovered = self.get_component_rich_style("dateselect--hovered-date")
+        return _DateSelectStyles(
+            base,
+            self.get_component_rich_style("dateselect--primary-date"),
+            secondary,
+            self.get_component_rich_style("dateselect--start-date"),
+            self.get_component_rich_style("dateselect--end-date"),
+            self.get_component_rich_style(
+                "dateselect--range-date"
+            ).background_style,
+            hovered.from_color(hovered.color),
+            self.get_component_rich_style("dateselect--cursor-date"),
+            {},
+            self._render_weekdays(base, secondary),
+            {},
+        )
+
     def get_content_height(
         self,
         container: Size,
@@ -777,8 +968,7 @@ class EndDateSelect(DateSelect):
 
     def _watch_end_date(self, date: Date | None) -> None:
         if date:
-            self.scope = DateScope.MONTH
-            self.loc = date
+            self._show_month(date)
             if self.date_range:
                 self.date = date - self.date_range
 
@@ -795,11 +985,10 @@ class EndDateSelect(DateSelect):
                 self.post_message(self.StartChanged(self, date))
 
     def _set_current_scope(self) -> None:
-        self.set_reactive(DateSelect.scope, DateScope.MONTH)
-        if self.end_date:
-            self.loc = self.end_date
-        elif self.date:
-            self.loc = self.date
+        if loc := self.end_date or self.date:
+            self._show_month(loc)
+        else:
+            self.set_reactive(DateSelect.scope, DateScope.MONTH)
 
 
 class DateOverlay(BaseOverlay):
@@ -824,7 +1013,7 @@ class DateOverlay(BaseOverlay):
 
     @cached_property
     def date_select(self) -> DateSelect:
-        return self.query_one(DateSelect)
+        return self.query_exactly_one(DateSelect)
 
 
 class EndDateOverlay(DateOverlay):
@@ -905,9 +1094,12 @@ class DateInput(AbstractInput[Date]):
     def watch_date(self, new: Date | None) -> None:
         # FIX: probably should prevent date changes
         with self.prevent(Input.Changed):
-            self.value = (
-                new.py_date().strftime(self.DATE_FORMAT) if new else ""
-            )
+            if not new:
+                self.value = ""
+            elif self.DATE_FORMAT == "%Y-%m-%d":
+                self.value = f"{new.year:04}-{new.month:02}-{new.day:02}"
+            else:
+                self.value = new.py_date().strftime(self.DATE_FORMAT)
         self.post_message(self.Updated(self, new))
 
     def _watch_value(self, value: str) -> None:
@@ -918,7 +1110,7 @@ class DateInput(AbstractInput[Date]):
         """Adjust date with an offset depending on the text cursor position."""
         try:
             if self.date is None:
-                self.date = Date.today_in_system_tz()
+                self.date = self._today()
             elif self._is_year_pos():
                 self.date = self.date.add(years=offset)
             elif self._is_month_pos():
@@ -940,29 +1132,41 @@ class DateInput(AbstractInput[Date]):
         return self.cursor_position >= 8
 
     def convert(self) -> Date | None:
+        value = self.value
+        if self.DATE_FORMAT == "%Y-%m-%d":
+            # NOTE: Fast path that skips strptime for the default format.
+            # Partial input is rejected before anything is sliced out.
+            if len(value) != 10 or not value[4] == value[7] == "-":
+                return None
+            year, month, day = value[:4], value[5:7], value[8:]
+            if not (year.isdigit() and month.isdigit() and day.isdigit()):
+                return None
+            try:
+                return Date(int(year), int(month), int(day))
+            except ValueError:
+                return None
+
         # NOTE: Pydate instead as I want to keep it open to standard formats.
         try:
             return Date.from_py_date(
-                datetime.strptime(self.value, self.DATE_FORMAT).date()
+                datetime.strptime(value, self.DATE_FORMAT).date()
             )
         except ValueError:
             return None
 
     def insert_text_at_cursor(self, text: str) -> None:
-        if not text.isdigit():
+        # NOTE: Set lookup skips the unicode digit check and rejects
+        # non-ascii digits that the date conversion can't handle anyway.
+        if not text or not DIGITS.issuperset(text):
             return
 
         # Extra Date Filtering
-        if self.cursor_position == 6 and text not in "012":
-            return
-
-        if self.cursor_position == 5 and text not in "0123":
+        cursor = self.cursor_position
+        if cursor == 5 and text not in "0123":
             return
 
-        if (
-            self.cursor_position == 6
-            and self.value[5] == "3"
-            and text not in "01"
+        if cursor == 6 and (
+            text not in "012" or (self.value[5] == "3" and text not in "01")
         ):
             return
 
@@ -1007,6 +1211,7 @@ class DatePicker(BasePicker[DateInput, Date, DateOverlay]):
             return self.date
 
     BINDING_GROUP_TITLE = "Date Picker"
+    INPUT = DateInput
     ALIAS = "date"
 
     DateValidator: TypeAlias = Callable[[Date | None], Date | None]
@@ -1048,16 +1253,18 @@ class DatePicker(BasePicker[DateInput, Date, DateOverlay]):
         self, action: str, parameters: tuple[object, ...]
     ) -> bool | None:
         if action == "target_today":
-            return self.date != Date.today_in_system_tz()
+            return self.date != self._today()
         return True
 
     def compose(self) -> ComposeResult:
         with Horizontal(id="input-control"):
-            yield DateInput(id="date-input").data_bind(date=DatePicker.date)
+            yield self._compose_input(
+                DateInput(id="date-input").data_bind(date=DatePicker.date)
+            )
 
             yield TargetButton(
                 id="target-default",
-                disabled=self.date == Date.today_in_system_tz(),
+                disabled=self.date == self._today(),
                 tooltip="Set the date to today.",
             )
             yield self._compose_expand_button()
@@ -1076,9 +1283,7 @@ class DatePicker(BasePicker[DateInput, Date, DateOverlay]):
         self.date = message.date
 
     def _watch_date(self, new: Date) -> None:
-        self.query_exactly_one("#target-default", Button).disabled = (
-            new == Date.today_in_system_tz()
-        )
+        self._target_button.disabled = new == self._today()
         self.post_message(self.Changed(self, new))
 
     @on(DateInput.Updated)
@@ -1094,4 +1299,4 @@ class DatePicker(BasePicker[DateInput, Date, DateOverlay]):
     def to_default(self) -> None:
         """Reset the date to today."""
         self.overlay.date_select.scope = DateScope.MONTH
-        self.date = Date.today_in_system_tz()
+        self.date = self._today()
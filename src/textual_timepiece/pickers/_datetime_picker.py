@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import cached_property
+from datetime import datetime
 from typing import TYPE_CHECKING
 from typing import ClassVar
 
@@ -12,10 +12,11 @@ from textual.widgets import Input
 from whenever import Date
 from whenever import PlainDateTime
 from whenever import Time
-from whenever import ZonedDateTime
 
 from textual_timepiece._extra import BaseMessage
 from textual_timepiece._extra import TargetButton
+from textual_timepiece._extra import cached_property
+from textual_timepiece._utility import DIGITS
 from textual_timepiece._utility import DateScope
 from textual_timepiece._utility import round_time
 
@@ -30,6 +31,15 @@ if TYPE_CHECKING:
     from textual.app import ComposeResult
 
 
+_ALLOWED_DIGITS: dict[int, str] = {
+    5: "0123",
+    6: "012",
+    14: "012345",
+    17: "012345",
+}
+"""Digits accepted by `DateTimeInput` at fixed cursor positions."""
+
+
 class DateTimeOverlay(BaseOverlay):
     date = var[Date | None](None, init=False)
 
@@ -65,7 +75,7 @@ class DateTimeOverlay(BaseOverlay):
 
     @cached_property
     def date_select(self) -> DateSelect:
-        return self.query_one(DateSelect)
+        return self.query_exactly_one(DateSelect)
 
 
 class DateTimeInput(AbstractInput[PlainDateTime]):
@@ -119,10 +129,15 @@ class DateTimeInput(AbstractInput[PlainDateTime]):
 
     def watch_datetime(self, value: PlainDateTime | None) -> None:
         with self.prevent(Input.Changed):
-            if value:
-                self.value = value.py_datetime().strftime(self.FORMAT)
-            else:
+            if not value:
                 self.value = ""
+            elif self.FORMAT == r"%Y-%m-%d %H:%M:%S":
+                # NOTE: Fixed ISO layout so the separator and any fractional
+                # seconds can be sliced off.
+                iso = value.format_iso()
+                self.value = f"{iso[:10]} {iso[11:19]}"
+            else:
+                self.value = value.py_datetime().strftime(self.FORMAT)
 
         self.post_message(self.Updated(self, self.datetime))
 
@@ -131,88 +146,76 @@ class DateTimeInput(AbstractInput[PlainDateTime]):
             self.datetime = dt
 
     def convert(self) -> PlainDateTime | None:
+        value = self.value
+        if self.FORMAT == r"%Y-%m-%d %H:%M:%S":
+            # NOTE: Fast path that skips strptime for the default format.
+            # The layout is checked first as fromisoformat accepts more
+            # variants on newer python versions.
+            if not (
+                len(value) == 19
+                and value[4] == value[7] == "-"
+                and value[10] == " "
+                and value[13] == value[16] == ":"
+            ):
+                return None
+            try:
+                return PlainDateTime.from_py_datetime(
+                    datetime.fromisoformat(value)
+                )
+            except ValueError:
+                return None
+
         try:
-            return PlainDateTime.parse_strptime(self.value, format=self.FORMAT)
+            return PlainDateTime.parse_strptime(value, format=self.FORMAT)
         except ValueError:
             return None
 
     def action_adjust_time(self, offset: int) -> None:
         """Adjust date with an offset depending on the text cursor position."""
+        cursor = self.cursor_position
         try:
-            if self.datetime is None:
-                self.datetime = ZonedDateTime.now_in_system_tz().to_plain()
-            elif self.cursor_position < 4:
-                self.datetime = self.datetime.add(
-                    years=offset,
-                    ignore_dst=True,
-                )
-            elif 5 <= self.cursor_position < 7:
-                self.datetime = self.datetime.add(
-                    months=offset,
-                    ignore_dst=True,
-                )
-            elif 8 <= self.cursor_position < 10:
-                self.datetime = self.datetime.add(
-                    days=offset,
-                    ignore_dst=True,
-                )
-            elif 11 <= self.cursor_position < 13:
-                self.datetime = self.datetime.add(
-                    hours=offset,
-                    ignore_dst=True,
-                )
-            elif 14 <= self.cursor_position < 16:
-                self.datetime = self.datetime.add(
-                    minutes=offset,
-                    ignore_dst=True,
-                )
+            if (dt := self.datetime) is None:
+                self.datetime = self._now()
+            elif cursor < 4:
+                self.datetime = dt.add(years=offset, ignore_dst=True)
+            elif 5 <= cursor < 7:
+                self.datetime = dt.add(months=offset, ignore_dst=True)
+            elif 8 <= cursor < 10:
+                self.datetime = dt.add(days=offset, ignore_dst=True)
+            elif 11 <= cursor < 13:
+                self.datetime = dt.add(hours=offset, ignore_dst=True)
+            elif 14 <= cursor < 16:
+                self.datetime = dt.add(minutes=offset, ignore_dst=True)
             else:
-                self.datetime = self.datetime.add(
-                    seconds=offset,
-                    ignore_dst=True,
-                )
+                self.datetime = dt.add(seconds=offset, ignore_dst=True)
         except ValueError as err:
             self.log.debug(err)
             if not str(err).endswith("out of range"):
                 raise
 
     def insert_text_at_cursor(self, text: str) -> None:
-        if not text.isdigit():
-            return
-
-        # Extra Date Filtering
-        if self.cursor_position == 6 and text not in "012":
+        # NOTE: Set lookup skips the unicode digit check and rejects
+        # non-ascii digits that the date conversion can't handle anyway.
+        if not text or not DIGITS.issuperset(text):
             return
 
-        if self.cursor_position == 5 and text not in "0123":
+        cursor = self.cursor_position
+        allowed = _ALLOWED_DIGITS.get(cursor)
+        if allowed is not None and text not in allowed:
             return
 
-        if (
-            self.cursor_position == 6
-            and self.value[5] == "3"
-            and text not in "01"
-        ):
+        value = self.value
+        # Extra Date Filtering
+        if cursor == 6 and value[5] == "3" and text not in "01":
             return
 
         # Extra Time Filtering
-        if self.cursor_position == 11:
-            if (
-                text == "2"
-                and len(self.value) >= 12
-                and self.value[12] not in "0123"
-            ):
-                self.value = self.value[:12] + "3" + self.value[13:]
+        if cursor == 11:
+            if text == "2" and len(value) >= 12 and value[12] not in "0123":
+                self.value = value[:12] + "3" + value[13:]
             elif text not in "012":
                 return
-
-        if (
-            self.cursor_position == 12
-            and self.value[11] == "2"
-            and text not in "0123"
-        ):
-            return
-
-        if self.cursor_position in {14, 17} and text not in "012345":
+        elif cursor == 12 and value[11] == "2" and text not in "0123":
             return
 
         super().insert_text_at_cursor(text)
@@ -257,7 +260,9 @@ class DateTimePicker(
 
     def compose(self) -> ComposeResult:
         with Horizontal(id="input-control"):
-            yield DateTimeInput().data_bind(DateTimePicker.datetime)
+            yield self._compose_input(
+                DateTimeInput().data_bind(DateTimePicker.datetime)
+            )
             yield TargetButton(
                 id="target-default",
                 tooltip="Set the datetime to now.",
@@ -287,7 +292,7 @@ class DateTimePicker(
         if not message.date:
             return
         if self.datetime:
-            self.datetime = self.datetime.time().on(message.date)
+            self.datetime = self.datetime.replace_date(message.date)
         else:
             self.datetime = message.date.at(Time())
 
@@ -306,27 +311,23 @@ class DateTimePicker(
         if self.datetime:
             self.datetime = self.datetime.add(message.delta, ignore_dst=True)
         else:
-            self.datetime = ZonedDateTime.now_in_system_tz().to_plain()
+            self.datetime = self._now()
 
     @on(TimeSelect.Selected)
     def _set_time(self, message: TimeSelect.Selected) -> None:
         message.stop()
         if self.datetime is None:
-            self.datetime = (
-                ZonedDateTime.now_in_system_tz()
-                .to_plain()
-                .replace_time(message.target)
-            )
+            self.datetime = self._now().replace_time(message.target)
         else:
             self.datetime = self.datetime.replace_time(message.target)
 
     @on(DateTimeInput.Updated)
     def _dt_input_changed(self, message: DateTimeInput.Updated) -> None:
         message.stop()
-        with self.input_widget.prevent(DateTimeInput.Updated):
+        with message.control.prevent(DateTimeInput.Updated):
             self.datetime = message.datetime
 
     def to_default(self) -> None:
         """Reset the picker datetime to the current time."""
-        self.datetime = ZonedDateTime.now_in_system_tz().to_plain()
+        self.datetime = self._now()
         self.overlay.date_select.scope = DateScope.MONTH
@@ -431,7 +431,7 @@ class DurationPicker(BasePicker[DurationInput, TimeDelta, DurationOverlay]):
 
     def compose(self) -> ComposeResult:
         with Horizontal(id="input-control"):
-            yield (
+            yield self._compose_input(
                 DurationInput(id="data-input").data_bind(
                     duration=DurationPicker.duration
                 )
@@ -445,14 +445,12 @@ class DurationPicker(BasePicker[DurationInput, TimeDelta, DurationOverlay]):
         yield DurationOverlay().data_bind(show=DurationPicker.expanded)
 
     def _on_mount(self, event: Mount) -> None:
-        self.query_exactly_one("#target-default", Button).disabled = (
+        self._target_button.disabled = (
             self.duration is None or self.duration.in_seconds() == 0
         )
 
     def _watch_duration(self, delta: TimeDelta) -> None:
-        self.query_exactly_one("#target-default", Button).disabled = (
-            delta is None or delta.in_seconds() == 0
-        )
+        self._target_button.disabled = delta is None or delta.in_seconds() == 0
         self.post_message(self.Changed(self, delta))
 
     @on(DurationSelect.Rounded)
@@ -647,7 +645,9 @@ class TimePicker(BasePicker[TimeInput, Time, TimeOverlay]):
 
     def compose(self) -> ComposeResult:
         with Horizontal(id="input-control"):
-            yield TimeInput(id="data-input").data_bind(time=TimePicker.time)
+            yield self._compose_input(
+                TimeInput(id="data-input").data_bind(time=TimePicker.time)
+            )
             yield TargetButton(id="target-default", tooltip="Set time to now.")
             yield self._compose_expand_button()
 
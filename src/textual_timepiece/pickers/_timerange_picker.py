@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import sys
-from functools import cached_property
 from typing import TYPE_CHECKING
 from typing import ClassVar
 from typing import cast
 
+from textual_timepiece._extra import cached_property
+
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
@@ -24,7 +25,6 @@ from whenever import DateDelta
 from whenever import PlainDateTime
 from whenever import Time
 from whenever import TimeDelta
-from whenever import ZonedDateTime
 
 from textual_timepiece._extra import BaseMessage
 from textual_timepiece._extra import LockButton
@@ -210,7 +210,7 @@ class DateRangePicker(AbstractPicker[DateRangeOverlay]):
                 self.end_date = date + self._date_range
 
         self.query_one("#target-default-start").disabled = (
-            date == Date.today_in_system_tz()
+            date == self._today()
         )
         self.post_message(self.Changed(self, date, self.end_date))
 
@@ -219,9 +219,7 @@ class DateRangePicker(AbstractPicker[DateRangeOverlay]):
             with self.prevent(self.Changed):
                 self.start_date = date - self._date_range
 
-        self.query_one("#target-default-end").disabled = (
-            date == Date.today_in_system_tz()
-        )
+        self.query_one("#target-default-end").disabled = date == self._today()
         self.post_message(self.Changed(self, self.start_date, date))
 
     @on(DateSelect.StartChanged)
@@ -254,7 +252,7 @@ class DateRangePicker(AbstractPicker[DateRangeOverlay]):
     ) -> None:
         if message:
             message.stop()
-        new_date = Date.today_in_system_tz()
+        new_date = self._today()
         if not self.end_date or new_date <= self.end_date:
             self.start_date = new_date
         else:
@@ -267,7 +265,7 @@ class DateRangePicker(AbstractPicker[DateRangeOverlay]):
     ) -> None:
         if message:
             message.stop()
-        new_date = Date.today_in_system_tz()
+        new_date = self._today()
         if not self.start_date or (new_date) >= self.start_date:
             self.end_date = new_date
         else:
@@ -640,7 +638,7 @@ class DateTimeRangePicker(AbstractPicker[DateTimeRangeOverlay]):
     ) -> None:
         if message:
             message.stop()
-        self.start_dt = ZonedDateTime.now_in_system_tz().to_plain()
+        self.start_dt = self._now()
 
     @on(Button.Pressed, "#target-default-end")
     def _action_target_default_end(
@@ -649,7 +647,7 @@ class DateTimeRangePicker(AbstractPicker[DateTimeRangeOverlay]):
     ) -> None:
         if message:
             message.stop()
-        now = ZonedDateTime.now_in_system_tz().to_plain()
+        now = self._now()
         if not self.start_dt or now >= self.start_dt:
             self.end_dt = now
         else:
@@ -1,12 +1,18 @@
 import asyncio
 
 import pytest
+from textual.events import MouseMove
+from textual.geometry import Offset
 from textual.pilot import Pilot
 from whenever import Date
 from whenever import DateDelta
 
+from textual_timepiece._utility import DateScope
+from textual_timepiece._utility import get_scope
+from textual_timepiece.pickers import DateInput
 from textual_timepiece.pickers import DatePicker
 from textual_timepiece.pickers import DateSelect
+from textual_timepiece.pickers._date_picker import DateCursor
 
 
 @pytest.fixture
@@ -26,6 +32,24 @@ async def test_picker_dialog(date_app):
         assert not date_app.query_one(DatePicker).expanded
 
 
+@pytest.mark.unit
+async def test_overlay_fast_toggle(date_app, monkeypatch):
+    async with date_app.run_test() as pilot:
+        overlay = date_app.widget.overlay
+        monkeypatch.setattr(overlay, "FAST_TOGGLE", True)
+        date_app.action_focus_next()
+
+        await pilot.press("shift+enter")
+        await pilot.pause()
+        assert overlay.styles.opacity == 1
+        assert overlay.display
+
+        await pilot.press("shift+enter")
+        await pilot.pause()
+        assert overlay.styles.opacity == 0
+        assert not overlay.display
+
+
 @pytest.mark.snapshot
 def test_date_dialog(date_app, snap_compare, freeze_time):
     async def run_before(pilot: Pilot):
@@ -36,6 +60,33 @@ def test_date_dialog(date_app, snap_compare, freeze_time):
     assert snap_compare(date_app, run_before=run_before)
 
 
+@pytest.mark.snapshot
+def test_date_dialog_hover(date_app, snap_compare, freeze_time):
+    async def run_before(pilot: Pilot):
+        date_app.action_focus_next()
+        date_app.widget.query_one("#target-default").press()
+        await pilot.press("shift+enter")
+        await pilot.wait_for_scheduled_animations()
+        select = date_app.widget.overlay.date_select
+        await pilot.hover(select, Offset(9, 7))
+        await pilot.hover(select, Offset(14, 9))
+
+    assert snap_compare(date_app, run_before=run_before)
+
+
+@pytest.mark.snapshot
+def test_date_dialog_cursor(date_app, snap_compare, freeze_time):
+    async def run_before(pilot: Pilot):
+        date_app.action_focus_next()
+        date_app.widget.query_one("#target-default").press()
+        await pilot.press("shift+enter")
+        await pilot.wait_for_scheduled_animations()
+        date_app.widget.overlay.date_select.focus()
+        await pilot.press("down", "down", "right", "down", "left", "up")
+
+    assert snap_compare(date_app, run_before=run_before)
+
+
 @pytest.mark.snapshot
 def test_mini_date_dialog(date_app, snap_compare, freeze_time):
     async def run_before(pilot: Pilot):
@@ -104,6 +155,52 @@ async def test_spinbox_features(date_app, freeze_time) -> None:
         assert date_app.widget.date == Date(2024, 3, 7)
 
 
+@pytest.mark.unit
+async def test_spinbox_batches_adjustments(date_app, freeze_time) -> None:
+    async with date_app.run_test() as pilot:
+        date_app.widget.date = Date(2025, 2, 6)
+        date_input = date_app.widget.input_widget
+        assert date_input is date_app.widget.query_one(DateInput)
+        date_input.cursor_position = 9
+
+        for value in (1, 1, -1, 2):
+            date_input._queue_adjustment(value)
+        assert date_app.widget.date == Date(2025, 2, 6)
+
+        await pilot.pause()
+        assert date_app.widget.date == Date(2025, 2, 9)
+
+
+@pytest.mark.unit
+async def test_spinbox_drag_spans_batches(date_app, freeze_time) -> None:
+    async with date_app.run_test() as pilot:
+        date_app.widget.date = Date(2025, 2, 6)
+        date_input = date_app.widget.input_widget
+
+        await pilot.mouse_down(date_input, Offset(11, 0))
+        x, y = date_input.region.offset + Offset(11, 0)
+        for _ in range(3):
+            date_app.post_message(
+                MouseMove(
+                    None,
+                    x=x,
+                    y=y,
+                    delta_x=0,
+                    delta_y=1,
+                    button=1,
+                    shift=False,
+                    meta=False,
+                    ctrl=False,
+                    screen_x=x,
+                    screen_y=y,
+                )
+            )
+            await pilot.pause()
+        await pilot.mouse_up(date_input, Offset(11, 0))
+
+        assert date_app.widget.date == Date(2025, 2, 3)
+
+
 @pytest.mark.unit
 async def test_clear_action(date_app) -> None:
     async with date_app.run_test() as pilot:
@@ -152,3 +249,91 @@ async def test_date_dialog_edge_cases(date_app, freeze_time):
         select.post_message(DateSelect.StartChanged(select, Date.MAX))
         await pilot.pause()
         assert date_app.widget.date == Date.MAX
+
+
+@pytest.mark.unit
+async def test_date_returns_to_month(date_app, freeze_time):
+    async with date_app.run_test():
+        select = date_app.widget.overlay.date_select
+        select.scope = DateScope.DECADE
+
+        select.date = Date(2025, 3, 14)
+        assert select.scope == DateScope.MONTH
+        assert select.loc == Date(2025, 3, 14)
+        assert select.data == get_scope(DateScope.MONTH, select.loc)
+        assert select.header == "March 2025"
+
+
+@pytest.mark.unit
+async def test_set_month(date_app, freeze_time):
+    async with date_app.run_test():
+        select = date_app.widget.overlay.date_select
+        select.loc = freeze_time
+        select.scope = DateScope.YEAR
+
+        select._set_month("Not a month")
+        assert select.scope == DateScope.YEAR
+
+        select._set_month("May")
+        assert select.scope == DateScope.MONTH
+        assert select.loc == Date(2025, 5, 6)
+
+
+@pytest.mark.unit
+async def test_scope_labels(date_app, freeze_time):
+    async with date_app.run_test():
+        select = date_app.widget.overlay.date_select
+        select.loc = freeze_time
+
+        select.scope = DateScope.DECADE
+        assert select._labels[0] == ["2020", "2021", "2022"]
+
+        select.scope = DateScope.CENTURY
+        assert select._labels[0] == ["2000-2009", "2010-2019", "2020-2029"]
+
+
+@pytest.mark.unit
+async def test_month_bounds(date_app, freeze_time):
+    async with date_app.run_test():
+        select = date_app.widget.overlay.date_select
+        select.date = Date(2025, 1, 20)
+        select.end_date = Date(2025, 3, 5)
+        select._is_range = True
+
+        select.loc = Date(2025, 1, 1)
+        assert select._month_bounds() == (20, 0, 20, 31)
+        select.loc = Date(2025, 2, 1)
+        assert select._month_bounds() == (0, 0, 1, 31)
+        select.loc = Date(2025, 3, 1)
+        assert select._month_bounds() == (0, 5, 1, 5)
+
+        select.loc = Date(2025, 4, 1)
+        _, _, low, high = select._month_bounds()
+        assert low > high
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2025-02-06", Date(2025, 2, 6)),
+        ("2025-02-30", None),
+        ("2025-13-01", None),
+        ("2025-02-", None),
+        ("2025- 2-06", None),
+        ("", None),
+    ],
+)
+def test_date_input_convert(value, expected):
+    date_input = DateInput()
+    date_input.value = value
+    assert date_input.convert() == expected
+
+
+@pytest.mark.unit
+def test_date_cursor_confine():
+    data = get_scope(DateScope.YEAR, Date(2025, 1, 1))
+    cursor = DateCursor(2, 1)
+    assert cursor.confine(data) is cursor
+    assert DateCursor(4, 9).confine(data) == DateCursor(4, 2)
+    assert cursor.replace(x=0) == DateCursor(2, 0)
@@ -4,6 +4,7 @@ from whenever import PlainDateTime
 from whenever import Time
 
 from textual_timepiece.pickers import DateSelect
+from textual_timepiece.pickers import DateTimeInput
 from textual_timepiece.pickers import DateTimePicker
 from textual_timepiece.pickers import TimeSelect
 
@@ -124,3 +125,53 @@ async def test_dt_input_edge_cases(datetime_app, freeze_time):
 
         datetime_app.widget.datetime = PlainDateTime.MIN
         await pilot.press("down")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2025-02-06 12:30:45", PlainDateTime(2025, 2, 6, 12, 30, 45)),
+        ("2025-02-06 24:00:00", None),
+        ("2025-02-30 12:30:45", None),
+        ("2025-02-06 12:30:", None),
+        ("2025-02-06T12:30:45", None),
+        ("", None),
+    ],
+)
+def test_datetime_input_convert(value, expected):
+    datetime_input = DateTimeInput()
+    datetime_input.value = value
+    assert datetime_input.convert() == expected
+
+
+@pytest.mark.unit
+async def test_datetime_input_format(create_app):
+    app = create_app(DateTimeInput)
+    async with app.run_test():
+        app.widget.datetime = PlainDateTime(2025, 2, 6, 9, 5, 1)
+        assert app.widget.value == "2025-02-06 09:05:01"
+
+
+@pytest.mark.unit
+async def test_datetime_input_filtering(create_app):
+    app = create_app(DateTimeInput(select_on_focus=False))
+    async with app.run_test() as pilot:
+        app.widget.datetime = PlainDateTime(2025, 2, 6, 9, 5, 1)
+        app.widget.focus()
+
+        app.widget.cursor_position = 14
+        await pilot.press("7")
+        assert app.widget.value == "2025-02-06 09:05:01"
+
+        app.widget.cursor_position = 11
+        await pilot.press("3")
+        assert app.widget.value == "2025-02-06 09:05:01"
+
+        app.widget.cursor_position = 14
+        await pilot.press("4")
+        assert app.widget.value == "2025-02-06 09:45:01"
+
+        app.widget.cursor_position = 17
+        app.widget.insert_text_at_cursor("²")
+        assert app.widget.value == "2025-02-06 09:45:01"
@@ -1,10 +1,17 @@
 import random
+from calendar import monthrange
 from collections import defaultdict
+from datetime import date
 from functools import partial
 
 import pytest
+from textual.events import Leave
+from textual.events import MouseMove
+from textual.geometry import Offset
+from whenever import Date
 
 from textual_timepiece._activity_heatmap import HeatmapCursor
+from textual_timepiece._activity_heatmap import _days_in_month
 from textual_timepiece.activity_heatmap import ActivityHeatmap
 from textual_timepiece.activity_heatmap import HeatmapManager
 
@@ -119,3 +126,117 @@ async def test_heatmap_navigation(
 
         await pilot.press("enter")
         assert heatmap_manager_app.widget.year == freeze_time.year + 6
+
+
+@pytest.mark.unit
+def test_generate_empty_activity_copies():
+    template = ActivityHeatmap.generate_empty_activity(2025)
+    template[0][-1] = None
+    template.pop()
+
+    fresh = ActivityHeatmap.generate_empty_activity(2025)
+    assert len(fresh) == len(template) + 1
+    assert fresh[0][-1] is not None
+
+
+@pytest.mark.unit
+async def test_heatmap_skips_identical_year_data(
+    heatmap_app, heatmap_data, freeze_time
+):
+    async with heatmap_app.run_test() as pilot:
+        heatmap_app.widget.year = freeze_time.year
+        heatmap_app.widget.values = heatmap_data
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+        processed = heatmap_app.widget._processed
+        assert processed is not None
+
+        other_year = defaultdict(lambda: 0, heatmap_data)
+        other_year[date(freeze_time.year + 1, 6, 1)] = 1
+        heatmap_app.widget.values = other_year
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+        assert heatmap_app.widget._processed is processed
+
+
+@pytest.mark.unit
+async def test_heatmap_tiles_reset_with_data(
+    heatmap_app, heatmap_data, freeze_time
+):
+    async with heatmap_app.run_test() as pilot:
+        heatmap = heatmap_app.widget
+        heatmap.values = heatmap_data
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+        assert heatmap._styles.tiles
+
+        heatmap.values = defaultdict(
+            lambda: 0, {day: value**2 for day, value in heatmap_data.items()}
+        )
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+        assert set(heatmap._styles.tiles) <= set(heatmap._tiles)
+
+
+@pytest.mark.unit
+async def test_heatmap_leave_drops_pending_move(heatmap_app, freeze_time):
+    async with heatmap_app.run_test() as pilot:
+        heatmap = heatmap_app.widget
+        heatmap.blur()
+        await pilot.pause()
+        assert heatmap.cursor is None
+
+        heatmap._on_mouse_move(
+            MouseMove(
+                heatmap,
+                x=5,
+                y=1,
+                delta_x=0,
+                delta_y=0,
+                button=0,
+                shift=False,
+                meta=False,
+                ctrl=False,
+            )
+        )
+        heatmap._on_leave(Leave(heatmap))
+        await pilot.pause()
+        assert heatmap.cursor is None
+
+
+@pytest.mark.unit
+def test_heatmap_offset_to_cursor():
+    heatmap = ActivityHeatmap()
+    assert heatmap._get_cursor_tile(Offset(4, 1)) is None
+    assert heatmap._get_cursor_tile(Offset(5, 1)) == HeatmapCursor(1, 1)
+    assert heatmap._get_cursor_tile(Offset(9, 13)) == HeatmapCursor(2, 7)
+    assert heatmap._get_cursor_tile(Offset(9, 12)) is None
+
+    assert heatmap._get_cursor_week(Offset(6, 15)) == HeatmapCursor(1, 8)
+    assert heatmap._get_cursor_week(Offset(7, 15)) is None
+
+    assert heatmap._is_offset_on_month(Offset(3, 17)) == 1
+    assert heatmap._is_offset_on_month(Offset(15, 17)) == 0
+    assert heatmap._is_offset_on_month(Offset(18, 17)) == 2
+    assert heatmap._is_offset_on_month(Offset(148, 17)) == 12
+
+
+@pytest.mark.unit
+async def test_heatmap_totals_follow_values(heatmap_app, freeze_time):
+    async with heatmap_app.run_test():
+        heatmap = heatmap_app.widget
+        start = Date(freeze_time.year, 1, 1)
+        heatmap.values = defaultdict(lambda: 0, {start.py_date(): 60})
+        assert heatmap.sum_week(start) == 60
+        assert heatmap.sum_month(start) == 60
+
+        heatmap.values = defaultdict(lambda: 0, {start.py_date(): 120})
+        assert heatmap.sum_week(start) == 120
+        assert heatmap.sum_month(start) == 120
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("year", [1, 1900, 2000, 2023, 2024, 2100, 9999])
+def test_days_in_month(year):
+    for month in range(1, 13):
+        assert _days_in_month(year, month) == monthrange(year, month)[1]
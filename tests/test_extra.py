@@ -1,7 +1,12 @@
+import time
+from functools import cached_property
+
 import pytest
 from rich.segment import Segment
 from textual.geometry import Offset
 from textual.strip import Strip
+from whenever import Instant
+from whenever import patch_current_time
 
 from textual_timepiece._extra import BaseWidget
 
@@ -32,3 +37,53 @@ def test_get_line_offset(create_app):
 
     assert app.widget.get_line_offset(Offset(5, 1)) == "is"
     assert app.widget.get_line_offset(Offset(5, 2)) == "are"
+
+
+class CachedWidget(BaseWidget):
+    @cached_property
+    def answer(self) -> int:
+        return 42
+
+
+@pytest.mark.unit
+def test_clear_cached_properties():
+    assert "answer" in tuple(CachedWidget.get_cached_properties())
+    assert "answer" not in tuple(BaseWidget.get_cached_properties())
+
+    widget = CachedWidget()
+    assert widget.answer == 42
+    assert "answer" in widget.__dict__
+
+    widget.clear_cached_properties()
+    assert "answer" not in widget.__dict__
+    widget.clear_cached_properties()
+
+
+@pytest.mark.unit
+def test_today_is_cached(freeze_time):
+    widget = BaseWidget()
+    assert widget._today() == freeze_time
+
+    cache = BaseWidget._today_cache
+    evening = Instant.from_utc(2025, 2, 6, 23, 59, 59)
+    with patch_current_time(evening, keep_ticking=False):
+        assert widget._today() == freeze_time
+        assert BaseWidget._today_cache is cache
+
+    with patch_current_time(Instant.from_utc(2025, 2, 7), keep_ticking=False):
+        assert widget._today() == freeze_time.add(days=1)
+
+
+@pytest.mark.unit
+def test_today_follows_wall_clock_past_midnight(freeze_time, monkeypatch):
+    # NOTE: A suspended machine keeps the monotonic clock still.
+    monkeypatch.setattr(time, "monotonic", lambda: 0.0)
+    first, second = BaseWidget(), BaseWidget()
+    assert first._today() == freeze_time
+    assert second._today() == freeze_time
+
+    with patch_current_time(
+        Instant.from_utc(2025, 2, 7, 8), keep_ticking=False
+    ):
+        assert first._today() == freeze_time.add(days=1)
+        assert second._today() == freeze_time.add(days=1)
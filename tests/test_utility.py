@@ -2,6 +2,7 @@ from datetime import datetime
 
 import pytest
 
+from textual_timepiece._utility import normalize_values
 from textual_timepiece._utility import time_to_seconds
 from textual_timepiece.utility import breakdown_seconds
 from textual_timepiece.utility import format_seconds
@@ -21,3 +22,9 @@ def test_format_seconds():
     dt = time_to_seconds(datetime(2025, 4, 2, 12, 30, 30))
     assert format_seconds(dt) == "12:30:30"
     assert format_seconds(dt, include_seconds=False) == "12:30"
+
+
+@pytest.mark.unit
+def test_normalize_values():
+    assert normalize_values([1, None, 3, 2]) == [0.0, None, 1.0, 0.5]
+    assert normalize_values([5, None, 5]) == [0.0, None, 0.0]